@@ -0,0 +1,125 @@
+# scripts/bench.py
+# Rough throughput comparisons: legacy per-character paths vs current engines.
+import os
+import random
+import time
+
+from cryptolib.classical.caesar import encrypt as c_enc
+from cryptolib.classical.vigenere import encrypt as v_enc, decrypt as v_dec
+from cryptolib.classical import shift
+from cryptolib.classical.playfair.playfair import encrypt as pf_enc, decrypt as pf_dec
+from cryptolib.classical.playfair.helpers import at, build_square, loc_map, prepare_pairs
+from cryptolib.cryptanalysis.batch import crack_many
+from cryptolib.cryptanalysis.caesar_attack import crack as c_crack
+
+def sep(title): print("\n" + "=" * 10, title, "=" * 10)
+
+def timeit(fn, *args, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+def report(label, n_bytes, t_old, t_new):
+    mb = n_bytes / 1e6
+    print(f"{label:<24} legacy {mb / t_old:8.1f} MB/s   new {mb / t_new:8.1f} MB/s   x{t_old / t_new:.1f}")
+
+def sample_text(n: int) -> str:
+    rnd = random.Random(1)
+    words = ["the", "quick", "brown", "fox", "jumps", "over", "lazy", "dog", "Straße", "log:", "42"]
+    out, size = [], 0
+    while size < n:
+        w = rnd.choice(words)
+        out.append(w)
+        size += len(w) + 1
+    return " ".join(out)[:n]
+
+# --- legacy implementations (per-character), kept here for comparison only ---
+
+def _legacy_clean(s):
+    return "".join(ch for ch in s.upper() if "A" <= ch <= "Z")
+
+def legacy_caesar(text, k):
+    return "".join(chr(((ord(c) - 65 + (k % 26)) % 26) + 65) for c in _legacy_clean(text))
+
+def legacy_vigenere(text, key, sign=1):
+    s, k = _legacy_clean(text), _legacy_clean(key)
+    out = []
+    for i, ch in enumerate(s):
+        out.append(chr(((ord(ch) - 65 + sign * (ord(k[i % len(k)]) - 65)) % 26) + 65))
+    return "".join(out)
+
+def legacy_playfair(text, key, sign=1):
+    # per-call square + per-digraph branching (decrypt: sign=-1; input must be clean pairs)
+    sq = build_square(key)
+    loc = loc_map(sq)
+    pairs = prepare_pairs(text) if sign == 1 else list(zip(text[0::2], text[1::2]))
+    out = []
+    for a, b in pairs:
+        (ra, ca), (rb, cb) = loc[a], loc[b]
+        if ra == rb:
+            out += [at(sq, ra, ca + sign), at(sq, rb, cb + sign)]
+        elif ca == cb:
+            out += [at(sq, ra + sign, ca), at(sq, rb + sign, cb)]
+        else:
+            out += [at(sq, ra, cb), at(sq, rb, ca)]
+    return "".join(out)
+
+def bench_shift_ciphers(n: int):
+    sep(f"Caesar / Vigenère ({n / 1e6:.0f} MB)")
+    text = sample_text(n)
+    assert c_enc(text, 7) == legacy_caesar(text, 7)
+    report("caesar encrypt", n, timeit(legacy_caesar, text, 7), timeit(c_enc, text, 7))
+    key = "LOGROTATIONKEY"
+    assert v_enc(text, key) == legacy_vigenere(text, key)
+    report("vigenere encrypt", n, timeit(legacy_vigenere, text, key), timeit(v_enc, text, key))
+    report("vigenere decrypt", n, timeit(legacy_vigenere, text, key, -1), timeit(v_dec, text, key))
+    if shift.np is not None:
+        clean = shift.clean_bytes(text)
+        shifts = shift.compile_key(key).shifts
+        report("translate -> numpy", len(clean),
+               timeit(shift._apply_shifts_translate, clean, shifts),
+               timeit(shift._apply_shifts_numpy, clean, shifts))
+
+def bench_playfair(n: int):
+    sep(f"Playfair ({n / 1e6:.0f} MB)")
+    text = sample_text(n)
+    key = "MONARCHY"
+    c = pf_enc(text, key)
+    assert c == legacy_playfair(text, key)
+    report("playfair encrypt", n, timeit(legacy_playfair, text, key), timeit(pf_enc, text, key))
+    report("playfair decrypt", len(c), timeit(legacy_playfair, c, key, -1), timeit(pf_dec, c, key))
+    short = [text[i: i + 200] for i in range(0, min(n, 400_000), 200)]
+    def many(fn):
+        for m in short:
+            fn(m, key)
+    report("playfair 200-char msgs", sum(map(len, short)),
+           timeit(many, lambda m, k: legacy_playfair(m, k)), timeit(many, pf_enc))
+
+def bench_batch(n_msgs: int):
+    sep(f"Batch Caesar cracking ({n_msgs} messages)")
+    rnd = random.Random(2)
+    msgs = [c_enc(sample_text(rnd.randint(40, 200)), rnd.randrange(26)) for _ in range(n_msgs)]
+    t0 = time.perf_counter()
+    for m in msgs:
+        c_crack(m)
+    serial = time.perf_counter() - t0
+    print(f"{'serial loop':<24} {n_msgs / serial:10.0f} msg/s")
+    cpus = os.cpu_count() or 1
+    for workers in sorted({1, 2, cpus}):
+        t0 = time.perf_counter()
+        for _ in crack_many(msgs, "caesar", max_workers=workers):
+            pass
+        dt = time.perf_counter() - t0
+        print(f"{f'crack_many x{workers}':<24} {n_msgs / dt:10.0f} msg/s   x{serial / dt:.1f} vs serial")
+
+def main():
+    n = int(os.environ.get("BENCH_BYTES", 4_000_000))
+    bench_shift_ciphers(n)
+    bench_playfair(n)
+    bench_batch(int(os.environ.get("BENCH_MSGS", 50_000)))
+
+if __name__ == "__main__":
+    main()
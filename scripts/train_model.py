@@ -0,0 +1,20 @@
+# scripts/train_model.py
+# Train a quadgram model file from plain-text corpora:
+#   python scripts/train_model.py en.cqg corpus1.txt [corpus2.txt ...]
+# Load it with cryptolib.cryptanalysis.scoring.load_model and pass it as scorer=.
+import sys
+import time
+
+from cryptolib.cryptanalysis.scoring import train_model
+
+def main(argv):
+    if len(argv) < 2:
+        print("usage: train_model.py MODEL CORPUS [CORPUS ...]")
+        return 2
+    t0 = time.perf_counter()
+    train_model(argv[1:], argv[0])
+    print(f"wrote {argv[0]} in {time.perf_counter() - t0:.2f}s")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -2,13 +2,57 @@ from math import gcd
 from cryptolib.exceptions import InvalidKeyError
 from cryptolib.mathutils.number import modinv
 
+def _check_square(M: list[list[int]]) -> int:
+    n = len(M)
+    if n == 0 or any(len(row) != n for row in M):
+        raise InvalidKeyError("Hill key must be a non-empty square matrix")
+    return n
+
+def det(M: list[list[int]]) -> int:
+    """Exact integer determinant (Bareiss fraction-free elimination)."""
+    n = _check_square(M)
+    A = [list(row) for row in M]
+    sign, prev = 1, 1
+    for k in range(n - 1):
+        if A[k][k] == 0:
+            for i in range(k + 1, n):
+                if A[i][k] != 0:
+                    A[k], A[i] = A[i], A[k]
+                    sign = -sign
+                    break
+            else:
+                return 0
+        for i in range(k + 1, n):
+            for j in range(k + 1, n):
+                A[i][j] = (A[i][j] * A[k][k] - A[i][k] * A[k][j]) // prev
+        prev = A[k][k]
+    return sign * A[n - 1][n - 1]
+
+def adjugate(M: list[list[int]]) -> list[list[int]]:
+    """Integer adjugate (transposed cofactor matrix), so M * adj(M) = det(M) * I."""
+    n = _check_square(M)
+    if n == 1:
+        return [[1]]
+    adj = [[0] * n for _ in range(n)]
+    for i in range(n):
+        for j in range(n):
+            minor = [row[:j] + row[j + 1:] for r, row in enumerate(M) if r != i]
+            adj[j][i] = (-1) ** (i + j) * det(minor)
+    return adj
+
 def mod26_det(M: list[list[int]]) -> int:
-    (a, b), (c, d) = M
-    return (a * d - b * c) % 26
+    return det(M) % 26
 
 def is_invertible_mod26(M: list[list[int]]) -> bool:
     return gcd(mod26_det(M), 26) == 1
 
+def inv_mod26(M: list[list[int]]) -> list[list[int]]:
+    """Inverse of an n×n matrix mod 26 via adj(M) * det(M)^{-1}."""
+    if not is_invertible_mod26(M):
+        raise InvalidKeyError("Hill key not invertible mod 26")
+    di = modinv(mod26_det(M), 26)
+    return [[(x * di) % 26 for x in row] for row in adjugate(M)]
+
 def inv2x2_mod26(M: list[list[int]]) -> list[list[int]]:
     (a, b), (c, d) = M
     det = mod26_det(M)
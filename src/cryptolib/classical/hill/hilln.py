@@ -0,0 +1,111 @@
+"""
+General n×n Hill cipher.
+
+A key is compiled once into a HillKey (validated, inverse mod 26 precomputed)
+and the whole message is processed as one (n × blocks) matrix product mod 26,
+vectorized with NumPy when available.
+"""
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import mul
+from typing import Union
+
+from cryptolib.text import clean_bytes
+from cryptolib.classical.stream import StreamCipher
+from .helpers import _check_square, inv_mod26
+
+try:
+    import numpy as np
+except ImportError:  # optional speed-up
+    np = None
+
+A0 = ord("A")
+
+Matrix = tuple[tuple[int, ...], ...]
+
+def _pad(data: bytes, n: int) -> bytes:
+    if len(data) % n:
+        data += b"X" * (n - len(data) % n)
+    return data
+
+def _apply(M: Matrix, data: bytes) -> bytes:
+    """Multiply every n-letter block of clean A-Z `data` by M (mod 26)."""
+    n = len(M)
+    data = _pad(data, n)
+    if not data:
+        return b""
+    if np is not None:
+        P = np.frombuffer(data, dtype=np.uint8).reshape(-1, n).T.astype(np.int32) - A0
+        C = np.asarray(M, dtype=np.int32) @ P
+        C %= 26
+        C += A0
+        return C.T.astype(np.uint8).tobytes()
+    cols = [[b - A0 for b in data[j::n]] for j in range(n)]
+    out = bytearray(len(data))
+    for i, row in enumerate(M):
+        out[i::n] = bytes(map(lambda *v: sum(map(mul, row, v)) % 26 + A0, *cols))
+    return bytes(out)
+
+class HillStream(StreamCipher):
+    """Incremental Hill; an incomplete trailing block is carried to the next chunk."""
+
+    def __init__(self, M: Matrix):
+        self._M = M
+        self._carry = b""
+
+    def _update(self, chunk: str) -> str:
+        data = self._carry + clean_bytes(chunk)
+        full = len(data) - len(data) % len(self._M)
+        self._carry = data[full:]
+        return _apply(self._M, data[:full]).decode("ascii")
+
+    def _finalize(self) -> str:
+        return _apply(self._M, self._carry).decode("ascii")  # pads with 'X'
+
+@dataclass(frozen=True)
+class HillKey:
+    """Compiled Hill key: matrix and its inverse, both reduced mod 26."""
+    matrix: Matrix
+    inverse: Matrix
+
+    @property
+    def n(self) -> int:
+        return len(self.matrix)
+
+    def encrypt(self, plaintext: str) -> str:
+        """Encrypt A-Z text (non-letters removed, padded with 'X' to a multiple of n)."""
+        return _apply(self.matrix, clean_bytes(plaintext)).decode("ascii")
+
+    def decrypt(self, ciphertext: str) -> str:
+        return _apply(self.inverse, clean_bytes(ciphertext)).decode("ascii")
+
+    def encryptor(self) -> HillStream:
+        return HillStream(self.matrix)
+
+    def decryptor(self) -> HillStream:
+        return HillStream(self.inverse)
+
+@lru_cache(maxsize=128)
+def _compile(matrix: Matrix) -> HillKey:
+    inverse = inv_mod26([list(row) for row in matrix])
+    return HillKey(matrix, tuple(map(tuple, inverse)))
+
+def compile_key(K: Union[list[list[int]], HillKey]) -> HillKey:
+    """Validate K (square, invertible mod 26) and precompute its inverse; cached per key."""
+    if isinstance(K, HillKey):
+        return K
+    _check_square(K)
+    return _compile(tuple(tuple(x % 26 for x in row) for row in K))
+
+def encrypt(plaintext: str, K: Union[list[list[int]], HillKey]) -> str:
+    return compile_key(K).encrypt(plaintext)
+
+def decrypt(ciphertext: str, K: Union[list[list[int]], HillKey]) -> str:
+    return compile_key(K).decrypt(ciphertext)
+
+def encryptor(K: Union[list[list[int]], HillKey]) -> HillStream:
+    """Incremental Hill encryption: update(chunk) -> str, finalize() -> str."""
+    return compile_key(K).encryptor()
+
+def decryptor(K: Union[list[list[int]], HillKey]) -> HillStream:
+    return compile_key(K).decryptor()
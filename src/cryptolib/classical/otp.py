@@ -1,9 +1,61 @@
+from typing import BinaryIO
+from cryptolib.classical.stream import StreamCipher
 from cryptolib.exceptions import ValidationError
+from cryptolib.io import readinto_full
+
+try:
+    import numpy as np
+except ImportError:  # optional speed-up; big-int XOR is the fallback
+    np = None
+
+CHUNK_SIZE = 1 << 20  # streaming granularity (bytes)
+
+def _bytes_view(buf) -> memoryview:
+    """Flat unsigned-byte view of any contiguous buffer (bytes, bytearray, memoryview, mmap)."""
+    return memoryview(buf).cast("B")
+
+def _xor(a: memoryview, b: memoryview) -> bytes:
+    if np is not None:
+        return np.bitwise_xor(np.frombuffer(a, dtype=np.uint8), np.frombuffer(b, dtype=np.uint8)).tobytes()
+    # word-wide XOR: one big integer per operand
+    return (int.from_bytes(a, "little") ^ int.from_bytes(b, "little")).to_bytes(len(a), "little")
 
 def xor_bytes(a: bytes, b: bytes) -> bytes:
-    if len(a) != len(b):
+    """a ⊕ b for any two equal-length buffers; returns bytes."""
+    va, vb = _bytes_view(a), _bytes_view(b)
+    if len(va) != len(vb):
         raise ValidationError("xor_bytes requires equal lengths")
-    return bytes(x ^ y for x, y in zip(a, b))
+    return _xor(va, vb)
+
+def xor_into(dst, a, b) -> None:
+    """Write a ⊕ b into the writable buffer dst (all equal length; dst may alias a or b)."""
+    vd, va, vb = _bytes_view(dst), _bytes_view(a), _bytes_view(b)
+    if not len(vd) == len(va) == len(vb):
+        raise ValidationError("xor_into requires equal lengths")
+    if vd.readonly:
+        raise ValidationError("xor_into destination must be writable")
+    if np is not None:
+        out = np.frombuffer(vd, dtype=np.uint8)
+        np.bitwise_xor(np.frombuffer(va, dtype=np.uint8), np.frombuffer(vb, dtype=np.uint8), out=out)
+    else:
+        vd[:] = _xor(va, vb)
+
+def xor_stream(src: BinaryIO, key: BinaryIO, dst: BinaryIO, chunk_size: int = CHUNK_SIZE) -> int:
+    """
+    Stream dst = src ⊕ key in fixed-size chunks (bounded memory).
+    The key stream must be at least as long as src. Returns bytes written.
+    """
+    buf, kbuf = memoryview(bytearray(chunk_size)), memoryview(bytearray(chunk_size))
+    total = 0
+    while True:
+        n = readinto_full(src, buf)
+        if n == 0:
+            return total
+        if readinto_full(key, kbuf[:n]) != n:
+            raise ValidationError("key stream shorter than input")
+        xor_into(buf[:n], buf[:n], kbuf[:n])
+        dst.write(buf[:n])
+        total += n
 
 def encrypt(plaintext: bytes, key: bytes) -> bytes:
     """
@@ -18,3 +70,39 @@ def decrypt(plaintext: bytes, key: bytes) -> bytes:
     if len(plaintext) != len(key):
         raise ValidationError("OTP key length must equal plaintext length")
     return xor_bytes(plaintext, key)
+
+def encrypt_stream(src: BinaryIO, key: BinaryIO, dst: BinaryIO, chunk_size: int = CHUNK_SIZE) -> int:
+    """Chunked OTP over file objects; the key stream must be exactly as long as src."""
+    n = xor_stream(src, key, dst, chunk_size)
+    if key.read(1):
+        raise ValidationError("OTP key length must equal plaintext length")
+    return n
+
+decrypt_stream = encrypt_stream
+
+class OTPStream(StreamCipher):
+    """Incremental OTP over an in-memory key; carries the key offset across chunks."""
+
+    def __init__(self, key: bytes):
+        self._key = _bytes_view(key)
+        self._offset = 0
+
+    def _update(self, chunk: bytes) -> bytes:
+        data = _bytes_view(chunk)
+        end = self._offset + len(data)
+        if end > len(self._key):
+            raise ValidationError("OTP key length must equal plaintext length")
+        out = _xor(data, self._key[self._offset:end])
+        self._offset = end
+        return out
+
+    def _finalize(self) -> bytes:
+        if self._offset != len(self._key):
+            raise ValidationError("OTP key length must equal plaintext length")
+        return b""
+
+def encryptor(key: bytes) -> OTPStream:
+    """Incremental OTP: update(chunk) -> bytes; finalize() checks the key was used up exactly."""
+    return OTPStream(key)
+
+decryptor = encryptor
@@ -1,9 +1,14 @@
+import re
+from cryptolib.text import clean_i
 from cryptolib.exceptions import ValidationError
 
 ALPH_NO_J = "ABCDEFGHIKLMNOPQRSTUVWXYZ"
 
+# one letter, then optionally a *different* letter: the digraph split rule
+_PAIR_RE = re.compile(r"(.)((?!\1).)?", re.DOTALL)
+
 def _normalize_key(key: str) -> str:
-    s = "".join(ch for ch in key.upper() if "A" <= ch <= "Z").replace("J", "I")
+    s = clean_i(key, cache=True)
     if not s:
         raise ValidationError("Playfair key must contain at least one A-Z letter")
     return s
@@ -38,20 +43,5 @@ def prepare_pairs(text: str) -> list[tuple[str, str]]:
     A-Z only, J -> I. Split into digraphs; if a pair has same letters, insert 'X';
     if last is single, pad with 'X'.
     """
-    s = "".join(ch for ch in text.upper() if "A" <= ch <= "Z").replace("J", "I")
-    pairs: list[tuple[str, str]] = []
-    i = 0
-    while i < len(s):
-        a = s[i]
-        if i + 1 == len(s):            # last single -> pad X
-            pairs.append((a, "X"))
-            i += 1
-            continue
-        b = s[i + 1]
-        if a == b:                     # double letter -> insert X
-            pairs.append((a, "X"))
-            i += 1
-        else:
-            pairs.append((a, b))
-            i += 2
-    return pairs
+    # double letter or last single -> the regex leaves b empty -> 'X'
+    return [(a, b or "X") for a, b in _PAIR_RE.findall(clean_i(text))]
@@ -1,45 +1,103 @@
-from .helpers import at, build_square, prepare_pairs, loc_map
+from functools import lru_cache
+from operator import add
+from cryptolib.classical.stream import StreamCipher
+from cryptolib.text import clean_i
+from .helpers import _PAIR_RE, at, build_square, prepare_pairs, loc_map
 
-def encrypt(plaintext: str, key: str) -> str:
-    """Playfair encrypt. Builds 5×5 square from key (I/J merged), splits plaintext into digraphs (inserting/padding 'X'), then applies rules: same row→right, same column→down, rectangle→swap columns. Returns A–Z uppercase ciphertext."""
-    sq = build_square(key)
+def _digraph_tables(sq: str) -> tuple[dict[str, str], dict[str, str]]:
+    """All 25×25 digraphs of the square -> their encryption / decryption."""
     loc = loc_map(sq)
-    out = []
-    for a, b in prepare_pairs(plaintext):
+    enc: dict[str, str] = {}
+    dec: dict[str, str] = {}
+    for a in sq:
         ra, ca = loc[a]
-        rb, cb = loc[b]
-        if ra == rb:         # same row -> shift right
-            out.append(at(sq, ra, ca + 1))
-            out.append(at(sq, rb, cb + 1))
-        elif ca == cb:       # same column -> shift down
-            out.append(at(sq, ra + 1, ca))
-            out.append(at(sq, rb + 1, cb))
-        else:                # rectangle -> swap columns
-            out.append(at(sq, ra, cb))
-            out.append(at(sq, rb, ca))
-    return "".join(out)
+        for b in sq:
+            rb, cb = loc[b]
+            if ra == rb:         # same row -> shift right / left
+                e = at(sq, ra, ca + 1) + at(sq, rb, cb + 1)
+                d = at(sq, ra, ca - 1) + at(sq, rb, cb - 1)
+            elif ca == cb:       # same column -> shift down / up
+                e = at(sq, ra + 1, ca) + at(sq, rb + 1, cb)
+                d = at(sq, ra - 1, ca) + at(sq, rb - 1, cb)
+            else:                # rectangle -> swap columns (self-inverse)
+                e = d = at(sq, ra, cb) + at(sq, rb, ca)
+            enc[a + b] = e
+            dec[a + b] = d
+    return enc, dec
+
+class PlayfairEncryptor(StreamCipher):
+    """Incremental Playfair encryption; a trailing single letter waits for its partner."""
+
+    def __init__(self, key: "PlayfairKey"):
+        self._enc = key.enc
+        self._pending = ""
+
+    def _update(self, chunk: str) -> str:
+        pairs = _PAIR_RE.findall(self._pending + clean_i(chunk))
+        # only the very last match can be a lone letter still awaiting its partner
+        self._pending = pairs.pop()[0] if pairs and not pairs[-1][1] else ""
+        enc = self._enc
+        return "".join([enc[a + (b or "X")] for a, b in pairs])
+
+    def _finalize(self) -> str:
+        return self._enc[self._pending + "X"] if self._pending else ""
+
+class PlayfairDecryptor(StreamCipher):
+    """Incremental Playfair decryption; an odd trailing letter is carried over."""
+
+    def __init__(self, key: "PlayfairKey"):
+        self._dec = key.dec
+        self._pending = ""
+
+    def _update(self, chunk: str) -> str:
+        s = self._pending + clean_i(chunk)
+        full = len(s) - len(s) % 2
+        self._pending = s[full:]
+        return "".join(map(self._dec.__getitem__, map(add, s[0:full:2], s[1:full:2])))
+
+    def _finalize(self) -> str:
+        return self._dec[self._pending + "X"] if self._pending else ""
+
+class PlayfairKey:
+    """Compiled Playfair key: square plus precomputed digraph lookup tables."""
+    __slots__ = ("square", "enc", "dec")
+
+    def __init__(self, key: str):
+        self.square = build_square(key)
+        self.enc, self.dec = _digraph_tables(self.square)
+
+    def encrypt(self, plaintext: str) -> str:
+        enc = self.enc
+        return "".join([enc[a + b] for a, b in prepare_pairs(plaintext)])
+
+    def decrypt(self, ciphertext: str) -> str:
+        s = clean_i(ciphertext)
+        if len(s) % 2 == 1:
+            s += "X"
+        return "".join(map(self.dec.__getitem__, map(add, s[0::2], s[1::2])))
+
+    def encryptor(self) -> PlayfairEncryptor:
+        return PlayfairEncryptor(self)
+
+    def decryptor(self) -> PlayfairDecryptor:
+        return PlayfairDecryptor(self)
+
+@lru_cache(maxsize=64)
+def compile_key(key: str) -> PlayfairKey:
+    """Return the compiled PlayfairKey for `key` (bounded LRU cache)."""
+    return PlayfairKey(key)
+
+def encrypt(plaintext: str, key: str) -> str:
+    """Playfair encrypt. Builds 5×5 square from key (I/J merged), splits plaintext into digraphs (inserting/padding 'X'), then applies rules: same row→right, same column→down, rectangle→swap columns. Returns A–Z uppercase ciphertext."""
+    return compile_key(key).encrypt(plaintext)
 
 def decrypt(ciphertext: str, key: str) -> str:
     """Playfair decrypt. Builds 5×5 square from key (I/J merged), cleans ciphertext to A–Z (J→I) and pads final single with 'X', then applies inverse rules: same row→left, same column→up, rectangle→swap columns. Returns A–Z uppercase plaintext (fillers not removed)."""
-    sq = build_square(key)
-    loc = loc_map(sq)
-    s = "".join(ch for ch in ciphertext.upper() if "A" <= ch <= "Z").replace("J", "I")
-    if len(s) % 2 == 1:
-        s += "X"
-    out = []
-    i = 0
-    while i < len(s):
-        a, b = s[i], s[i + 1]
-        ra, ca = loc[a]
-        rb, cb = loc[b]
-        if ra == rb:         # same row -> shift left
-            out.append(at(sq, ra, ca - 1))
-            out.append(at(sq, rb, cb - 1))
-        elif ca == cb:       # same column -> shift up
-            out.append(at(sq, ra - 1, ca))
-            out.append(at(sq, rb - 1, cb))
-        else:                # rectangle -> swap columns
-            out.append(at(sq, ra, cb))
-            out.append(at(sq, rb, ca))
-        i += 2
-    return "".join(out)
+    return compile_key(key).decrypt(ciphertext)
+
+def encryptor(key: str) -> PlayfairEncryptor:
+    """Incremental Playfair encryption: update(chunk) -> str, finalize() -> str."""
+    return compile_key(key).encryptor()
+
+def decryptor(key: str) -> PlayfairDecryptor:
+    return compile_key(key).decryptor()
@@ -0,0 +1,95 @@
+"""
+Translation-table engine for the shift ciphers (Caesar, Vigenère).
+
+Each shift k (0..25) is a precompiled `bytes.translate` table, so a whole
+column of text is shifted in one C-level pass instead of chr/ord per letter.
+Large inputs go through a NumPy backend when NumPy is installed.
+"""
+from dataclasses import dataclass
+from functools import lru_cache
+from cryptolib.text import clean_bytes
+from .stream import StreamCipher
+
+try:
+    import numpy as np
+except ImportError:  # optional speed-up; the translate path is the fallback
+    np = None
+
+ALPH = b"ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+A0 = ord("A")
+
+# one table per shift: SHIFT_TABLES[k] maps A..Z -> (A..Z + k) mod 26
+SHIFT_TABLES = tuple(bytes.maketrans(ALPH, ALPH[k:] + ALPH[:k]) for k in range(26))
+
+# inputs at least this long use the NumPy backend (if available)
+NUMPY_THRESHOLD = 4096
+
+def apply_shifts(data: bytes, shifts: tuple[int, ...]) -> bytes:
+    """Shift clean A-Z bytes periodically: data[i] += shifts[i % len(shifts)] (mod 26)."""
+    if np is not None and len(data) >= NUMPY_THRESHOLD:
+        return _apply_shifts_numpy(data, shifts)
+    return _apply_shifts_translate(data, shifts)
+
+def _apply_shifts_translate(data: bytes, shifts: tuple[int, ...]) -> bytes:
+    m = len(shifts)
+    if m == 1:
+        return data.translate(SHIFT_TABLES[shifts[0] % 26])
+    out = bytearray(len(data))
+    for r in range(min(m, len(data))):
+        out[r::m] = data[r::m].translate(SHIFT_TABLES[shifts[r] % 26])
+    return bytes(out)
+
+def _apply_shifts_numpy(data: bytes, shifts: tuple[int, ...]) -> bytes:
+    a = np.frombuffer(data, dtype=np.uint8)
+    # (k - 'A') mod 256, so that a + k lands in 0..50 with uint8 wrap-around
+    k = np.array([(s % 26 - A0) & 0xFF for s in shifts], dtype=np.uint8)
+    if k.size < 64:
+        k = np.tile(k, -(-64 // k.size))  # wider rows vectorize better
+    m = k.size
+    x = np.empty_like(a)
+    full = a.size - a.size % m
+    np.add(a[:full].reshape(-1, m), k, out=x[:full].reshape(-1, m))
+    np.add(a[full:], k[: a.size - full], out=x[full:])
+    # x in 0..25 stays (x - 26 wraps to >= 230); x in 26..50 becomes x - 26
+    np.minimum(x, x - np.uint8(26), out=x)
+    x += np.uint8(A0)
+    return x.tobytes()
+
+class ShiftStream(StreamCipher):
+    """Incremental periodic shift; carries the key position across chunks."""
+
+    def __init__(self, shifts: tuple[int, ...]):
+        self._shifts = shifts
+        self._pos = 0
+
+    def _update(self, chunk: str) -> str:
+        data = clean_bytes(chunk)
+        r, m = self._pos, len(self._shifts)
+        self._pos = (r + len(data)) % m
+        return apply_shifts(data, self._shifts[r:] + self._shifts[:r]).decode("ascii")
+
+@dataclass(frozen=True)
+class ShiftKey:
+    """Compiled periodic shift key; `shifts` are the per-position shifts (0..25)."""
+    shifts: tuple[int, ...]
+
+    @property
+    def inverse(self) -> tuple[int, ...]:
+        return tuple(-k % 26 for k in self.shifts)
+
+    def encrypt(self, text: str) -> str:
+        return apply_shifts(clean_bytes(text), self.shifts).decode("ascii")
+
+    def decrypt(self, text: str) -> str:
+        return apply_shifts(clean_bytes(text), self.inverse).decode("ascii")
+
+    def encryptor(self) -> ShiftStream:
+        return ShiftStream(self.shifts)
+
+    def decryptor(self) -> ShiftStream:
+        return ShiftStream(self.inverse)
+
+@lru_cache(maxsize=128)
+def compile_key(key: str) -> ShiftKey:
+    """Compile a cleaned A-Z key string into a ShiftKey (cached per key)."""
+    return ShiftKey(tuple(ord(ch) - A0 for ch in key))
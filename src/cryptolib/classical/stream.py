@@ -0,0 +1,31 @@
+"""
+Incremental update()/finalize() interface for the classical ciphers.
+
+Concatenating the outputs of update() over any chunking of the input, plus
+finalize(), equals the one-shot encrypt/decrypt of the whole input.
+"""
+from abc import ABC, abstractmethod
+
+from cryptolib.exceptions import ValidationError
+
+class StreamCipher(ABC):
+    """Base class: subclasses implement _update(chunk) and _finalize()."""
+    _finalized = False
+
+    def update(self, chunk):
+        if self._finalized:
+            raise ValidationError("cipher stream already finalized")
+        return self._update(chunk)
+
+    def finalize(self):
+        if self._finalized:
+            raise ValidationError("cipher stream already finalized")
+        self._finalized = True
+        return self._finalize()
+
+    @abstractmethod
+    def _update(self, chunk):
+        """Process one chunk; return the output it completes."""
+
+    def _finalize(self):
+        return ""
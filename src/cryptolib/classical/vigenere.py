@@ -1,33 +1,25 @@
 from cryptolib.exceptions import ValidationError
-
-A0 = ord("A")
+from cryptolib.text import clean
+from .shift import ShiftStream, compile_key
 
 def _clean_text(s: str) -> str:
-    return "".join(ch for ch in s.upper() if "A" <= ch <= "Z")
+    return clean(s)
 
 def _clean_key(key: str) -> str:
-    k = "".join(ch for ch in key.upper() if "A" <= ch <= "Z")
+    k = clean(key, cache=True)
     if not k:
         raise ValidationError("Vigenère key must contain at least one A-Z letter")
     return k
 
-def _shift_char(ch: str, k: int) -> str:
-    return chr(((ord(ch) - A0 + k) % 26) + A0)
-
 def encrypt(plaintext: str, key: str) -> str:
-    s = _clean_text(plaintext)
-    k = _clean_key(key)
-    out = []
-    for i, ch in enumerate(s):
-        ki = ord(k[i % len(k)]) - A0
-        out.append(_shift_char(ch, ki))
-    return "".join(out)
+    return compile_key(_clean_key(key)).encrypt(plaintext)
 
 def decrypt(ciphertext: str, key: str) -> str:
-    s = _clean_text(ciphertext)
-    k = _clean_key(key)
-    out = []
-    for i, ch in enumerate(s):
-        ki = ord(k[i % len(k)]) - A0
-        out.append(_shift_char(ch, -ki))
-    return "".join(out)
+    return compile_key(_clean_key(key)).decrypt(ciphertext)
+
+def encryptor(key: str) -> ShiftStream:
+    """Incremental Vigenère encryption; the key position carries across chunks."""
+    return compile_key(_clean_key(key)).encryptor()
+
+def decryptor(key: str) -> ShiftStream:
+    return compile_key(_clean_key(key)).decryptor()
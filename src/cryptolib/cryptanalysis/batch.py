@@ -0,0 +1,132 @@
+"""
+Batch cracking of large ciphertext corpora over a process pool.
+
+Ciphertexts are read lazily, grouped into chunks (many short messages per
+task, to amortize IPC), and fanned out to a ProcessPoolExecutor with a
+bounded number of chunks in flight, so memory stays flat for any corpus size.
+"""
+import os
+import signal
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import dataclass
+from itertools import count
+from typing import Any, Callable, Iterable, Iterator, Optional, Union
+
+from cryptolib.cryptanalysis import caesar_attack, vigenere_attack
+
+# attacks selectable by name; any picklable (module-level) callable also works
+ATTACKS: dict[str, Callable[[str], tuple]] = {
+    "caesar": caesar_attack.crack,
+    "vigenere": vigenere_attack.crack,
+}
+
+@dataclass(frozen=True)
+class BatchResult:
+    index: int                       # position in the input iterable
+    key: Any = None
+    plaintext: Optional[str] = None
+    error: Optional[str] = None      # "timeout", or the attack's exception message
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+class _ItemTimeout(Exception):
+    pass
+
+def _on_alarm(signum, frame):
+    raise _ItemTimeout()
+
+@contextmanager
+def _time_limit(seconds: Optional[float]):
+    # per-item limits need SIGALRM timers (POSIX, main thread of the worker;
+    # crack_many rejects item_timeout where setitimer is missing)
+    if not seconds or not hasattr(signal, "setitimer") or threading.current_thread() is not threading.main_thread():
+        yield
+        return
+    old = signal.signal(signal.SIGALRM, _on_alarm)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, old)
+
+def _crack_chunk(attack: Union[str, Callable], items: list[tuple[int, str]],
+                 item_timeout: Optional[float]) -> list[BatchResult]:
+    fn = ATTACKS[attack] if isinstance(attack, str) else attack
+    out = []
+    for idx, c in items:
+        try:
+            with _time_limit(item_timeout):
+                key, pt = fn(c)
+            out.append(BatchResult(idx, key, pt))
+        except _ItemTimeout:
+            out.append(BatchResult(idx, error="timeout"))
+        except Exception as e:  # one bad message must not sink the batch
+            out.append(BatchResult(idx, error=f"{type(e).__name__}: {e}"))
+    return out
+
+def _chunks(ciphertexts: Iterable[str], chunk_chars: int, max_items: int) -> Iterator[list[tuple[int, str]]]:
+    chunk, size = [], 0
+    for idx, c in zip(count(), ciphertexts):
+        chunk.append((idx, c))
+        size += len(c)
+        if size >= chunk_chars or len(chunk) >= max_items:
+            yield chunk
+            chunk, size = [], 0
+    if chunk:
+        yield chunk
+
+def crack_many(ciphertexts: Iterable[str], attack: Union[str, Callable] = "caesar", *,
+               max_workers: Optional[int] = None, ordered: bool = True,
+               item_timeout: Optional[float] = None, chunk_chars: int = 1 << 16,
+               max_items: int = 512, cancel: Optional[threading.Event] = None) -> Iterator[BatchResult]:
+    """
+    Crack every ciphertext with `attack` ("caesar", "vigenere" or a picklable
+    callable returning (key, plaintext)) in worker processes.
+
+    Yields BatchResult in input order (ordered=True) or as chunks complete.
+    item_timeout bounds each message's crack time; it needs signal.setitimer
+    (POSIX) and raises ValueError where that is unavailable rather than being
+    ignored. Setting `cancel` or closing the generator cancels all work not
+    yet started.
+    """
+    if isinstance(attack, str) and attack not in ATTACKS:
+        raise ValueError(f"unknown attack {attack!r}; choose from {sorted(ATTACKS)}")
+    if item_timeout and not hasattr(signal, "setitimer"):
+        raise ValueError("item_timeout needs signal.setitimer, which this platform lacks")
+    workers = max_workers or os.cpu_count() or 1
+    max_in_flight = 4 * workers
+    chunks = _chunks(ciphertexts, chunk_chars, max_items)
+    pending: deque[Future] = deque()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        try:
+            for chunk in chunks:
+                if cancel is not None and cancel.is_set():
+                    return
+                pending.append(pool.submit(_crack_chunk, attack, chunk, item_timeout))
+                while len(pending) >= max_in_flight:
+                    yield from _drain(pending, ordered, cancel)
+            while pending:
+                yield from _drain(pending, ordered, cancel)
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+def _drain(pending: deque, ordered: bool, cancel: Optional[threading.Event]) -> Iterator[BatchResult]:
+    """Yield the results of the oldest chunk (ordered) or of whichever finish first."""
+    if ordered:
+        done = [pending.popleft()]
+    else:
+        finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+        done = [f for f in pending if f in finished]
+        for f in done:
+            pending.remove(f)
+    for fut in done:
+        if cancel is not None and cancel.is_set():
+            pending.clear()
+            return
+        yield from fut.result()
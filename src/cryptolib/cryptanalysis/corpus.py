@@ -0,0 +1,92 @@
+"""
+Streaming n-gram counting over plain-text corpora of any size.
+
+Counts of 1- to 4-grams live in fixed-size flat arrays (26**n entries, indexed
+by base-26 code); text is fed chunk by chunk and the last three letters are
+carried over, so n-grams spanning chunk boundaries are counted exactly once.
+"""
+import os
+from array import array
+from collections import Counter
+from itertools import repeat
+from operator import add, mul
+from typing import BinaryIO, Iterable, Optional, Union
+
+from cryptolib.text import ALPH, TextLike, clean_bytes
+
+try:
+    import numpy as np
+except ImportError:  # optional speed-up
+    np = None
+
+CHUNK_SIZE = 1 << 20  # bytes read per step
+MAX_N = 4
+
+_TO_DIGITS = bytes.maketrans(ALPH, bytes(range(26)))
+
+class NgramCounter:
+    """Accumulates 1..4-gram counts of clean A-Z text fed through update()."""
+
+    def __init__(self):
+        if np is not None:
+            self._counts = [np.zeros(26 ** n, dtype=np.int64) for n in range(1, MAX_N + 1)]
+        else:
+            self._counts = [array("Q", bytes(8 * 26 ** n)) for n in range(1, MAX_N + 1)]
+        self._carry = b""
+
+    def update(self, chunk: TextLike) -> None:
+        """Count the letters of chunk (continuing the text fed so far)."""
+        new = clean_bytes(chunk).translate(_TO_DIGITS)
+        if not new:
+            return
+        d, skip = self._carry + new, len(self._carry)
+        self._carry = d[-(MAX_N - 1):]
+        if np is not None:
+            a = np.frombuffer(d, dtype=np.uint8).astype(np.int64)
+            codes = a
+            for n, hist in enumerate(self._counts, 1):
+                if n > 1:
+                    codes = codes[:-1] * 26 + a[n - 1:]
+                # n-grams starting before skip - n + 1 were counted with the previous chunk
+                hist += np.bincount(codes[max(skip - n + 1, 0):], minlength=hist.size)
+            return
+        codes: Iterable[int] = d
+        for n, hist in enumerate(self._counts, 1):
+            if n > 1:
+                codes = list(map(add, map(mul, codes, repeat(26)), d[n - 1:]))
+            for c, k in Counter(codes[max(skip - n + 1, 0):]).items():
+                hist[c] += k
+
+    def counts(self) -> list[list[int]]:
+        """counts[n-1][code] for n = 1..4."""
+        return [hist.tolist() for hist in self._counts]
+
+    @property
+    def letters(self) -> int:
+        """Letters counted so far."""
+        return int(sum(self._counts[0]))
+
+def count_text(text: TextLike) -> list[list[int]]:
+    """1..4-gram counts of one in-memory text."""
+    counter = NgramCounter()
+    counter.update(text)
+    return counter.counts()
+
+def count_file(source: Union[str, os.PathLike, BinaryIO], chunk_size: int = CHUNK_SIZE,
+               counter: Optional[NgramCounter] = None) -> NgramCounter:
+    """
+    Stream a corpus (path or binary file object) through an NgramCounter in
+    fixed-size chunks; memory stays bounded for any file size. Bytes outside
+    ASCII letters (including UTF-8 multibyte sequences) are skipped.
+    """
+    if counter is None:
+        counter = NgramCounter()
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            return count_file(f, chunk_size, counter)
+    buf = memoryview(bytearray(chunk_size))
+    while True:
+        n = source.readinto(buf)
+        if not n:
+            return counter
+        counter.update(buf[:n])
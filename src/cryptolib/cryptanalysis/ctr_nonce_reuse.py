@@ -1,4 +1,24 @@
+"""
+AES-CTR with a reused (key, nonce): every message is XORed with the same
+keystream, so column q of all ciphertexts is English XOR one keystream byte.
+
+ColumnStats streams ciphertexts into one 256-bin histogram per column (memory
+is O(width), not O(messages)); estimate() scores all 256 candidates of every
+column in a single histogram × XOR-score-matrix product.
+"""
+from dataclasses import dataclass
+from itertools import islice
+from typing import Iterable, Optional
+
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptolib.cryptanalysis.frequency import xor_key_scores
+
+try:
+    import numpy as np
+except ImportError:  # optional speed-up
+    np = None
+
+BATCH = 4096  # ciphertexts per histogram update
 
 def aes_ctr_encrypt(key: bytes, nonce: bytes, plaintext: bytes) -> bytes:
     """
@@ -15,3 +35,77 @@ def xor_plaintexts_from_reuse(c1: bytes, c2: bytes) -> bytes:
     """
     from cryptolib.classical.otp import xor_bytes
     return xor_bytes(c1, c2)
+
+@dataclass(frozen=True)
+class KeystreamEstimate:
+    keystream: bytes
+    confidence: tuple[float, ...]  # posterior of each chosen byte under the English byte model
+    depth: tuple[int, ...]         # ciphertexts covering each column
+
+    def decrypt(self, ciphertext: bytes) -> bytes:
+        """Ciphertext XOR the estimated keystream (truncated to the known width)."""
+        return bytes(c ^ k for c, k in zip(ciphertext, self.keystream))
+
+class ColumnStats:
+    """Per-column byte histograms of ciphertexts sharing one keystream from offset 0."""
+
+    def __init__(self, max_len: Optional[int] = None):
+        self.max_len = max_len  # ignore bytes past this column (None: grow as needed)
+        self.width = 0
+        self.hist = np.zeros((0, 256), dtype=np.int64) if np is not None else []
+
+    def _grow(self, width: int) -> None:
+        if width <= self.width:
+            return
+        if np is not None:
+            self.hist = np.vstack((self.hist, np.zeros((width - self.width, 256), dtype=np.int64)))
+        else:
+            self.hist.extend([0] * 256 for _ in range(width - self.width))
+        self.width = width
+
+    def update(self, ciphertexts: Iterable[bytes]) -> None:
+        cts = [c[:self.max_len] for c in ciphertexts] if self.max_len is not None else list(ciphertexts)
+        self._grow(max(map(len, cts), default=0))
+        if np is not None:
+            lens = np.fromiter(map(len, cts), dtype=np.int64, count=len(cts))
+            flat = np.frombuffer(b"".join(cts), dtype=np.uint8)
+            cols = np.arange(flat.size) - np.repeat(np.cumsum(lens) - lens, lens)
+            self.hist += np.bincount(cols * 256 + flat, minlength=self.width * 256).reshape(self.width, 256)
+            return
+        for c in cts:
+            for q, b in enumerate(c):
+                self.hist[q][b] += 1
+
+    def estimate(self) -> KeystreamEstimate:
+        """Most likely keystream byte of every column and its posterior probability."""
+        if np is not None:
+            scores = xor_key_scores(self.hist)  # [column, key byte] log10 likelihoods
+            best = scores.argmax(axis=1)
+            rel = scores - scores[np.arange(self.width), best][:, None]
+            conf = 1.0 / (10.0 ** rel).sum(axis=1)
+            depth = self.hist.sum(axis=1)
+            return KeystreamEstimate(best.astype(np.uint8).tobytes(), tuple(conf.tolist()), tuple(depth.tolist()))
+        ks, conf = bytearray(), []
+        for h in self.hist:
+            sc = xor_key_scores(h)
+            k = sc.index(max(sc))
+            ks.append(k)
+            conf.append(1.0 / sum(10.0 ** (s - sc[k]) for s in sc))
+        return KeystreamEstimate(bytes(ks), tuple(conf), tuple(sum(h) for h in self.hist))
+
+def estimate_keystream(ciphertexts: Iterable[bytes], max_len: Optional[int] = None,
+                       batch: int = BATCH) -> KeystreamEstimate:
+    """
+    Statistical keystream recovery for many ciphertexts under one (key, nonce):
+    each column's byte is the candidate whose decryption of that column is
+    most English-like. Ciphertexts are consumed `batch` at a time, so any
+    iterable (e.g. a generator over 100k records) runs in O(width) memory.
+    """
+    stats = ColumnStats(max_len)
+    it = iter(ciphertexts)
+    while True:
+        chunk = list(islice(it, batch))
+        if not chunk:
+            break
+        stats.update(chunk)
+    return stats.estimate()
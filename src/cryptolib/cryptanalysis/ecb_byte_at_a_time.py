@@ -0,0 +1,124 @@
+"""
+Byte-at-a-time ECB suffix recovery against an encryption oracle
+E(prefix || input || secret) with a fixed key, prefix and secret.
+
+Oracle calls are the cost that matters, so every step is batched into as few
+calls as possible: the block size comes from one call, the prefix length from
+one call (probe segments at every alignment), and each secret byte from one
+call that carries all 256 candidate blocks next to the target block and is
+matched through a block -> byte dictionary. Recovering n bytes takes about
+n + 4 calls instead of the naive ~256 n.
+"""
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from cryptolib.exceptions import ValidationError
+
+Oracle = Callable[[bytes], bytes]
+
+MAX_BLOCK = 64
+FILL = b"A"
+_PROBE = (b"\x00", b"\xff")  # alternating fillers of the prefix probe segments
+
+class CountingOracle:
+    """Wrap an oracle and count its calls and the input bytes sent."""
+
+    def __init__(self, oracle: Oracle):
+        self.oracle = oracle
+        self.calls = self.bytes_sent = 0
+
+    def __call__(self, data: bytes) -> bytes:
+        self.calls += 1
+        self.bytes_sent += len(data)
+        return self.oracle(data)
+
+@dataclass(frozen=True)
+class SuffixRecovery:
+    secret: bytes
+    block: int
+    prefix_len: int
+    queries: int  # oracle calls made, detection included
+
+def _runs(ct: bytes, block: int) -> list[tuple[int, bytes]]:
+    """(first block index, block) of every maximal run of >= 2 equal adjacent aligned blocks."""
+    blocks = [ct[i:i + block] for i in range(0, len(ct) - block + 1, block)]
+    out, k = [], 0
+    while k < len(blocks) - 1:
+        j = k
+        while j + 1 < len(blocks) and blocks[j + 1] == blocks[k]:
+            j += 1
+        if j > k:
+            out.append((k, blocks[k]))
+        k = j + 1
+    return out
+
+def detect_block_size(oracle: Oracle, max_block: int = MAX_BLOCK) -> int:
+    """
+    Block size from one call: 3·max_block equal bytes hold two adjacent aligned
+    equal blocks for any block size up to max_block; the smallest size (>= 4,
+    dividing the ciphertext length) showing such a pair is the block size.
+    Raises ValidationError if none does (the oracle is not ECB).
+    """
+    ct = oracle(FILL * (3 * max_block))
+    for b in range(4, max_block + 1):
+        if len(ct) % b == 0 and _runs(ct, b):
+            return b
+    raise ValidationError("oracle output shows no repeated blocks: not ECB (or block > max_block)")
+
+def detect_prefix_length(oracle: Oracle, block: int) -> int:
+    """
+    Prefix length from one call. The input is block + 1 segments of 3·block - 1
+    bytes (enough for two whole blocks at any alignment) with alternating
+    fillers; segment j starts at input offset o_j, so its first whole filler
+    block starts at P + o_j rounded up to a block. Offsets of segments 1..block
+    cover every residue mod block, hence P = min_j(start_j - o_j). Segment 0 is
+    a guard: the prefix may end in filler bytes and lengthen its run.
+    """
+    seg = 3 * block - 1
+    ct = oracle(b"".join(_PROBE[j % 2] * seg for j in range(block + 1)))
+    runs = _runs(ct, block)
+    # the probe is the first chain of block + 1 runs alternating two ciphertext blocks
+    for i in range(len(runs) - block):
+        chain = runs[i:i + block + 1]
+        a, b = chain[0][1], chain[1][1]
+        if a != b and all(r[1] == (a, b)[j % 2] for j, r in enumerate(chain)):
+            return min(k * block - j * seg for j, (k, _) in enumerate(chain) if j)
+    raise ValidationError("could not locate the probe blocks: not an ECB prefix oracle")
+
+def recover_suffix(oracle: Oracle, block: Optional[int] = None, prefix_len: Optional[int] = None,
+                   max_len: Optional[int] = None) -> SuffixRecovery:
+    """
+    Recover the secret the oracle appends to its input. Block size and prefix
+    length are detected unless given. Each call sends the 256 candidate blocks
+    (last block - 1 known bytes + guess) followed by filler that puts the next
+    secret byte at the end of a block; the target block is looked up in the
+    candidates' ciphertext blocks. Recovery stops at the first miss or once
+    the ciphertext length rules out further secret bytes; a PKCS#7 oracle also
+    matches its first pad byte, so one trailing 0x01 before a miss is dropped.
+    """
+    counter = oracle if isinstance(oracle, CountingOracle) else CountingOracle(oracle)
+    start_calls = counter.calls
+    block = block or detect_block_size(counter)
+    prefix_len = detect_prefix_length(counter, block) if prefix_len is None else prefix_len
+    align = -prefix_len % block
+    dict_at = prefix_len + align              # first candidate block (aligned)
+    base = dict_at + 256 * block              # where the shift filler starts
+    secret = bytearray()
+    missed = False
+    while max_len is None or len(secret) < max_len:
+        i = len(secret)
+        shift = block - 1 - i % block
+        known = (FILL * (block - 1) + secret)[-(block - 1):]
+        ct = counter(FILL * align + b"".join(known + bytes((c,)) for c in range(256)) + FILL * shift)
+        if i >= len(ct) - base - shift:  # slot i lies past the ciphertext
+            break
+        table = {ct[dict_at + c * block:dict_at + (c + 1) * block]: c for c in range(256)}
+        end = base + shift + i + 1                # secret byte i closes this block
+        c = table.get(ct[end - block:end])
+        if c is None:
+            missed = True
+            break
+        secret.append(c)
+    if missed and secret.endswith(b"\x01"):
+        del secret[-1]
+    return SuffixRecovery(bytes(secret), block, prefix_len, counter.calls - start_calls)
@@ -1,4 +1,221 @@
+"""
+ECB detection: identical plaintext blocks give identical ciphertext blocks.
+
+scan() walks any buffer (bytes, bytearray, mmap) through memoryview windows
+for every alignment offset, tracking a digest -> first-position table instead
+of block copies; reported repeats are verified against the bytes. Memory is
+bounded by forgetting the oldest blocks once max_tracked are held per offset:
+ECB regions repeat locally, so a window of recent blocks still finds them.
+"""
+import mmap
+import os
+from dataclasses import dataclass
+from itertools import islice
+from typing import Iterable, Optional, Sequence, Union
+
+try:
+    import numpy as np
+except ImportError:  # optional speed-up
+    np = None
+
+CHUNK_SIZE = 1 << 18  # bytes per window (rounded down to whole blocks)
+
 def has_repeated_blocks(ciphertext: bytes, block: int = 16) -> bool:
     """Detect ECB pattern leak: any repeated block appears identical."""
-    blocks = [ciphertext[i: i + block] for i in range(0, len(ciphertext), block)]
-    return len(set(blocks)) < len(blocks)
+    view = memoryview(ciphertext).cast("B")
+    seen = set()
+    for i in range(0, len(view) - block + 1, block):
+        b = view[i:i + block].tobytes()
+        if b in seen:
+            return True
+        seen.add(b)
+    return False
+
+@dataclass(frozen=True)
+class EcbReport:
+    block: int
+    offset: int                             # alignment with the most repeats
+    blocks: int                             # whole blocks at that offset
+    repeats: int                            # blocks equal to an earlier (tracked) block
+    positions: tuple[tuple[int, int], ...]  # (position, earlier occurrence), first few repeats
+
+    @property
+    def is_ecb(self) -> bool:
+        return self.repeats > 0
+
+    @property
+    def repeat_ratio(self) -> float:
+        return self.repeats / self.blocks if self.blocks else 0.0
+
+_K1, _K2 = 0x9E3779B97F4A7C15, 0xBF58476D1CE4E5B9
+
+def _digests(window: memoryview, block: int):
+    """64-bit digest of every whole block in the window (NumPy)."""
+    n = len(window) // block
+    if block % 8 == 0:
+        words = np.frombuffer(window, dtype=np.uint64, count=n * block // 8).reshape(n, block // 8)
+    else:
+        words = np.frombuffer(window, dtype=np.uint8, count=n * block).reshape(n, block).astype(np.uint64)
+    h = np.zeros(n, dtype=np.uint64)
+    for j in range(words.shape[1]):
+        h ^= words[:, j]
+        h *= np.uint64(_K1)
+        h ^= h >> np.uint64(29)
+    h *= np.uint64(_K2)
+    return h ^ (h >> np.uint64(32))
+
+class _OffsetTracker:
+    """Repeat tracking for one alignment offset: digest -> first position of the most recent blocks."""
+
+    def __init__(self, view: memoryview, block: int, offset: int, max_tracked: int, max_positions: int):
+        self.view, self.block, self.offset = view, block, offset
+        self.max_tracked, self.max_positions = max_tracked, max_positions
+        self.blocks = self.repeats = 0
+        self.positions: list[tuple[int, int]] = []
+        if np is not None:
+            # sorted runs of (digests, first positions), oldest first; neighbours
+            # of similar size merge, and the oldest run is evicted past max_tracked
+            self.runs: list[tuple] = []
+        else:
+            self.firsts: dict[int, int] = {}  # insertion order = age
+
+    def _record(self, pos: int, first: int) -> None:
+        b = self.block
+        # digests may collide: only report repeats the bytes confirm
+        if self.view[pos:pos + b] == self.view[first:first + b]:
+            self.positions.append((pos, first))
+
+    def feed(self, start: int, window: memoryview) -> None:
+        n = len(window) // self.block
+        self.blocks += n
+        if np is not None:
+            self._feed_numpy(start, window, n)
+        else:
+            self._feed_dict(start, window, n)
+
+    def _feed_numpy(self, start: int, window: memoryview, n: int) -> None:
+        h = _digests(window, self.block)
+        pos = start + np.arange(n, dtype=np.int64) * self.block
+        order = np.argsort(h)
+        h, pos = h[order], pos[order]
+        starts = np.flatnonzero(np.concatenate(([True], h[1:] != h[:-1])))
+        uniq, cnt = h[starts], np.diff(np.append(starts, len(h)))
+        first_pos = np.minimum.reduceat(pos, starts)
+        known = np.zeros(len(uniq), dtype=bool)
+        for keys, _ in self.runs:
+            idx = np.minimum(np.searchsorted(keys, uniq), len(keys) - 1)
+            known |= keys[idx] == uniq
+        new = ~known
+        self.repeats += n - int(new.sum())
+        room = self.max_positions - len(self.positions)
+        if room > 0 and n > int(new.sum()):
+            group_first = np.repeat(np.where(new, first_pos, -1), cnt)
+            rep = np.flatnonzero(pos != group_first)
+            rep = rep[np.argsort(pos[rep], kind="stable")][:room]
+            for p, d in zip(pos[rep].tolist(), h[rep].tolist()):
+                first = self._first(d)
+                self._record(p, first if first is not None else int(first_pos[np.searchsorted(uniq, np.uint64(d))]))
+        if new.any():
+            self.runs.append((uniq[new], first_pos[new]))
+            self._merge_runs()
+
+    def _merge_runs(self) -> None:
+        runs = self.runs
+        while len(runs) > 1 and sum(len(k) for k, _ in runs) > self.max_tracked:
+            runs.pop(0)
+        while len(runs) > 1 and len(runs[-2][0]) <= 2 * len(runs[-1][0]) \
+                and len(runs[-2][0]) + len(runs[-1][0]) <= self.max_tracked:
+            b, a = runs.pop(), runs.pop()
+            # linear merge of two sorted runs (digests are disjoint): scatter by rank
+            ia = np.arange(len(a[0])) + np.searchsorted(b[0], a[0])
+            ib = np.arange(len(b[0])) + np.searchsorted(a[0], b[0])
+            merged = []
+            for xa, xb in zip(a, b):
+                out = np.empty(len(xa) + len(xb), dtype=xa.dtype)
+                out[ia], out[ib] = xa, xb
+                merged.append(out)
+            runs.append(tuple(merged))
+
+    def _first(self, digest: int) -> Optional[int]:
+        d = np.uint64(digest)
+        for keys, firsts in self.runs:
+            i = int(np.searchsorted(keys, d))
+            if i < len(keys) and keys[i] == d:
+                return int(firsts[i])
+        return None
+
+    def _feed_dict(self, start: int, window: memoryview, n: int) -> None:
+        b, firsts = self.block, self.firsts
+        data = window.tobytes()
+        for k in range(n):
+            h = hash(data[k * b:(k + 1) * b])
+            p = start + k * b
+            first = firsts.setdefault(h, p)
+            if first != p:
+                self.repeats += 1
+                if len(self.positions) < self.max_positions:
+                    self._record(p, first)
+        excess = len(firsts) - self.max_tracked
+        if excess > 0:
+            for h in list(islice(firsts, excess)):
+                del firsts[h]
+
+    def report(self) -> EcbReport:
+        return EcbReport(self.block, self.offset, self.blocks, self.repeats, tuple(self.positions))
+
+def scan(data, block: int = 16, offsets: Optional[Sequence[int]] = None, *,
+         chunk_size: int = CHUNK_SIZE, max_tracked: int = 1 << 16,
+         max_positions: int = 64) -> EcbReport:
+    """
+    Count repeated blocks at every alignment offset (0..block-1 by default)
+    in one pass over `data` (any buffer, e.g. an mmap); report the offset with
+    the most repeats. Each offset remembers about the max_tracked most recent
+    distinct blocks, so memory is bounded and repeats farther apart than that
+    window are not counted.
+    """
+    view = memoryview(data).cast("B")
+    offsets = range(block) if offsets is None else offsets
+    trackers = [_OffsetTracker(view, block, o, max_tracked, max_positions) for o in offsets]
+    step = max(chunk_size // block, 1) * block
+    for base in range(0, len(view), step):
+        for t in trackers:
+            start = base + t.offset
+            end = min(start + step, len(view))
+            end -= (end - start) % block
+            if end > start:
+                t.feed(start, view[start:end])
+    best = max(trackers, key=lambda t: (t.repeats, -t.offset))
+    return best.report()
+
+def scan_file(path: Union[str, os.PathLike], block: int = 16, **kwargs) -> EcbReport:
+    """scan() over a memory-mapped file (multi-GB images stay out of RAM)."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return scan(b"", block, **kwargs)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            report = scan(mm, block, **kwargs)
+    return report
+
+def _repeat_ratio(view: memoryview, block: int, offsets: Iterable[int]) -> float:
+    """Best repeated-block fraction over offsets; a set of blocks is cheapest for short inputs."""
+    best = 0.0
+    for o in offsets:
+        blocks = [view[i:i + block].tobytes() for i in range(o, len(view) - block + 1, block)]
+        if blocks:
+            best = max(best, 1 - len(set(blocks)) / len(blocks))
+    return best
+
+def rank(ciphertexts: Iterable[bytes], block: int = 16, top: Optional[int] = None,
+         all_offsets: bool = False) -> list[tuple[int, EcbReport]]:
+    """
+    Score a batch of ciphertexts by repeated-block fraction (offset 0, or the
+    best alignment) and return (index, report) pairs, most ECB-like first;
+    full reports are built only for the `top` returned.
+    """
+    cts = list(ciphertexts)
+    offsets = range(block) if all_offsets else (0,)
+    ratios = [_repeat_ratio(memoryview(c).cast("B"), block, offsets) for c in cts]
+    order = sorted(range(len(cts)), key=lambda i: (-ratios[i], i))
+    if top is not None:
+        order = order[:top]
+    return [(i, scan(cts[i], block, offsets)) for i in order]
@@ -1,7 +1,31 @@
-from cryptolib.classical.hill.helpers import inv2x2_mod26
+import math
+from functools import lru_cache
+from typing import List, Optional, Tuple
+from cryptolib.classical.hill import hill2, hilln
+from cryptolib.classical.hill.helpers import inv2x2_mod26, is_invertible_mod26
+from cryptolib.cryptanalysis.frequency import FREQ_EN, chisq_counts
+from cryptolib.cryptanalysis.scoring import QuadgramScorer, default_scorer
+from cryptolib.exceptions import ValidationError
+from cryptolib.mathutils.linalg import RowBasis, crt_matrix
+from cryptolib.text import clean_bytes
+
+try:
+    import numpy as np
+except ImportError:  # optional speed-up
+    np = None
 
 A0 = ord("A")
 
+@lru_cache(maxsize=1)
+def _row_lut() -> List[bytes]:
+    """
+    lut[r][x*26 + y] = (a*x + b*y) % 26 for inverse-key row r = a*26 + b: the
+    plaintext letter row r yields from ciphertext digraph xy (key-independent).
+    Built on first use, not at import.
+    """
+    return [bytes((a * x + b * y) % 26 for x in range(26) for y in range(26))
+            for a in range(26) for b in range(26)]
+
 def _v(pair: str) -> list[int]:
     return [ord(pair[0]) - A0, ord(pair[1]) - A0]
 
@@ -28,3 +52,106 @@ def recover_key(p1: str, p2: str, c1: str, c2: str) -> list[list[int]]:
     C = _mat_from_pairs(c1, c2)
     Pinv = inv2x2_mod26(P)
     return _mat_mul(C, Pinv)
+
+def recover_key_n(plaintext: str, ciphertext: str, n: int) -> List[List[int]]:
+    """
+    Known-plaintext Hill n×n: K with C = K * P (mod 26) from a crib of any
+    length. Crib blocks stream into one incremental basis mod 2 and one mod 13
+    (each keeps only blocks independent of those before, so an invertible
+    subset is found in a single pass); each is solved by Gaussian elimination
+    and the two keys are joined with the CRT. The key is checked against every
+    crib block.
+    Raises NotInvertibleError if the crib never spans (Z/p)^n, ValidationError
+    if the crib is inconsistent with any Hill key.
+    """
+    p, c = clean_bytes(plaintext), clean_bytes(ciphertext)
+    blocks = min(len(p), len(c)) // n
+    bases = (RowBasis(n, 2), RowBasis(n, 13))
+    # C_j = K P_j for every block j  <=>  P_j^T K^T = C_j^T: one basis row per block
+    for j in range(0, blocks * n, n):
+        pb, cb = [x - A0 for x in p[j:j + n]], [x - A0 for x in c[j:j + n]]
+        for basis in bases:
+            if not basis.full:
+                basis.add(pb, cb)
+        if all(b.full for b in bases):
+            break
+    Kt = crt_matrix([b.solve() for b in bases], (2, 13))
+    K = [list(col) for col in zip(*Kt)]
+    if not is_invertible_mod26(K) or hilln.encrypt(p[:blocks * n].decode("ascii"), K) != c[:blocks * n].decode("ascii"):
+        raise ValidationError("crib is not consistent with a single Hill key")
+    return K
+
+def _digraph_codes(ciphertext: str) -> list[int]:
+    """Ciphertext digraphs xy as codes x*26 + y (a trailing odd letter is ignored)."""
+    c = clean_bytes(ciphertext)
+    if len(c) < 4:
+        raise ValidationError("Need at least two A–Z digraphs of Hill ciphertext")
+    return [(x - A0) * 26 + (y - A0) for x, y in zip(c[0::2], c[1::2])]
+
+@lru_cache(maxsize=1)
+def _row_tables():
+    """(676 × 676 row LUT, flat bincount index row*26 + letter) as NumPy arrays, built once."""
+    lut = np.frombuffer(b"".join(_row_lut()), dtype=np.uint8).reshape(676, 676)
+    return lut, (np.arange(676)[:, None] * 26 + lut).ravel()
+
+def row_scores(ciphertext: str) -> List[float]:
+    """
+    Chi-square (vs English) of the letters every candidate inverse-key row
+    (a, b), index a*26 + b, produces from the ciphertext digraphs. Both rows
+    of the true inverse key score low; work is 676 × 676 whatever the length.
+    """
+    hist = [0] * 676
+    for code in _digraph_codes(ciphertext):
+        hist[code] += 1
+    if np is not None:
+        lut, idx = _row_tables()
+        obs = np.bincount(idx, weights=np.tile(np.asarray(hist, dtype=np.float64), 676),
+                          minlength=676 * 26).reshape(676, 26)
+        expected = obs.sum(axis=1, keepdims=True) * (np.asarray(FREQ_EN) / 100.0)
+        return ((obs - expected) ** 2 / expected).sum(axis=1).tolist()
+    seen = [(code, h) for code, h in enumerate(hist) if h]
+    out = []
+    for lut in _row_lut():
+        obs = [0] * 26
+        for code, h in seen:
+            obs[lut[code]] += h
+        out.append(chisq_counts(obs))
+    return out
+
+def crack_2x2(ciphertext: str, top_k: int = 12,
+              scorer: Optional[QuadgramScorer] = None) -> Tuple[List[List[int]], str]:
+    """
+    Ciphertext-only Hill 2×2: return (K, plaintext) with C = K * P (mod 26).
+    The rows of K^{-1} are searched separately (676 candidates each, scored by
+    row_scores); the top_k rows are paired into invertible matrices only, and
+    the pair whose decryption scores best under the quadgram model wins.
+    """
+    scorer = scorer or default_scorer()
+    codes = _digraph_codes(ciphertext)
+    sc = row_scores(ciphertext)
+    rows = sorted(range(676), key=sc.__getitem__)[:top_k]
+    if np is not None:
+        lut, _ = _row_tables()
+        cnp = np.asarray(codes, dtype=np.intp)
+        plain = np.empty(2 * len(codes), dtype=np.uint8)
+    else:
+        lut = _row_lut()
+        plain = bytearray(2 * len(codes))
+    best, best_inv = -math.inf, None
+    for r1 in rows:
+        for r2 in rows:
+            inv = [list(divmod(r1, 26)), list(divmod(r2, 26))]
+            if r1 == r2 or not is_invertible_mod26(inv):
+                continue
+            if np is not None:
+                plain[0::2], plain[1::2] = lut[r1, cnp], lut[r2, cnp]
+            else:
+                plain[0::2] = bytes(map(lut[r1].__getitem__, codes))
+                plain[1::2] = bytes(map(lut[r2].__getitem__, codes))
+            score = scorer.score_digits(plain)
+            if score > best:
+                best, best_inv = score, inv
+    if best_inv is None:
+        raise ValidationError("No invertible key among the top row candidates; raise top_k")
+    K = inv2x2_mod26(best_inv)
+    return K, hill2.decrypt(ciphertext, K)
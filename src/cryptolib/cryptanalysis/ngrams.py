@@ -0,0 +1,87 @@
+"""
+Compact n-gram index for period finding (Kasiski examination).
+
+n-grams of clean A-Z text are encoded as base-26 integers (built by rolling
+the (n-1)-gram codes), kept in flat arrays, and repeats are found by sorting
+codes instead of storing every substring in a dict.
+"""
+from array import array
+from collections import Counter
+from itertools import repeat
+from operator import add, mul
+from typing import Iterable
+
+from cryptolib.text import TextLike, clean_bytes
+
+try:
+    import numpy as np
+except ImportError:  # optional speed-up
+    np = None
+
+_TO_DIGITS = bytes.maketrans(b"ABCDEFGHIJKLMNOPQRSTUVWXYZ", bytes(range(26)))
+
+def _typecode(n: int) -> str:
+    return "I" if 26 ** n < 2 ** 32 else "Q"
+
+class NgramIndex:
+    """Integer-coded n-grams of lengths min_len..max_len over clean A-Z text."""
+
+    def __init__(self, text: TextLike, min_len: int = 3, max_len: int = 5):
+        if not 1 <= min_len <= max_len <= 13:  # 26**13 < 2**64
+            raise ValueError("require 1 <= min_len <= max_len <= 13")
+        self.min_len, self.max_len = min_len, max_len
+        self.digits = clean_bytes(text).translate(_TO_DIGITS)
+        self._codes: dict[int, array] = {}
+        prev: Iterable[int] = repeat(0)
+        for n in range(1, max_len + 1):
+            # code_n[i] = code_{n-1}[i] * 26 + digit[i + n - 1]
+            codes = array(_typecode(n), map(add, map(mul, prev, repeat(26)), self.digits[n - 1:]))
+            if n >= min_len:
+                self._codes[n] = codes
+            prev = codes
+
+    def codes(self, n: int) -> array:
+        """Base-26 codes of every n-gram, indexed by start position."""
+        return self._codes[n]
+
+    def repeat_distances(self, n: int) -> list[int]:
+        """Distances between consecutive occurrences of every repeated n-gram."""
+        codes = self._codes[n]
+        if len(codes) < 2:
+            return []
+        if np is not None:
+            c = np.frombuffer(codes, dtype=np.uint32 if codes.typecode == "I" else np.uint64)
+            order = np.argsort(c, kind="stable")
+            same = c[order[1:]] == c[order[:-1]]
+            return np.diff(order)[same].tolist()
+        # sort (code, position) packed into one int; equal neighbours are repeats
+        N = len(codes)
+        keys = sorted(map(add, map(mul, codes, repeat(N)), range(N)))
+        return [b - a for a, b in zip(keys, keys[1:]) if a // N == b // N]
+
+    def distances(self) -> list[int]:
+        """Repeat distances for all indexed n-gram lengths."""
+        out: list[int] = []
+        for n in range(self.min_len, self.max_len + 1):
+            out += self.repeat_distances(n)
+        return out
+
+    def factor_histogram(self, max_factor: int = 40) -> list[tuple[int, int]]:
+        """
+        Ranked (factor, count) pairs, count = repeat distances divisible by factor
+        (2..max_factor). Only factors seen more often than chance are kept, ranked by
+        the excess count/total - 1/factor, which puts the true period above both its
+        divisors and its multiples.
+        """
+        dist = Counter(self.distances())
+        total = sum(dist.values())
+        if not total:
+            return []
+        hist = {f: 0 for f in range(2, max_factor + 1)}
+        for d, cnt in dist.items():
+            for f in hist:
+                if d % f == 0:
+                    hist[f] += cnt
+        excess = {f: c / total - 1 / f for f, c in hist.items()}
+        ranked = sorted((f for f in hist if excess[f] > 0), key=lambda f: (-excess[f], f))
+        return [(f, hist[f]) for f in ranked]
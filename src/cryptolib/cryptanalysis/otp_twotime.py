@@ -1,4 +1,25 @@
+"""
+Key reuse in OTP / stream ciphers: ciphertexts under one keystream XOR to the
+XOR of their plaintexts.
+
+drag_crib() places a guessed plaintext fragment at every position of every
+message. Each placement implies a keystream window, and that window is scored
+by decrypting the same columns of *every* message (so each pair of messages is
+checked at once). Per-column byte histograms turn the score of a keystream byte
+into one table lookup (frequency.xor_score_matrix), so a drag costs one gather
+per crib byte per placement whatever the number of messages.
+"""
+from dataclasses import dataclass
+from typing import Iterable, Optional, Sequence
+
 from cryptolib.classical.otp import xor_bytes
+from cryptolib.cryptanalysis.frequency import BYTE_LOGP_EN, xor_score_matrix
+from cryptolib.exceptions import ValidationError
+
+try:
+    import numpy as np
+except ImportError:  # optional speed-up
+    np = None
 
 def c1_xor_c2(c1: bytes, c2: bytes) -> bytes:
     """Return m1⊕m2 when the *same OTP key* was reused (c1⊕c2 = m1⊕m2)."""
@@ -9,5 +30,133 @@ def recover_with_crib(c1: bytes, c2: bytes, crib: bytes, pos: int) -> bytes:
     If you know m1 segment at position pos (crib), recover m2 segment there:
     m2[pos..] = (c1⊕c2)[pos..] ⊕ crib
     """
-    x = c1_xor_c2(c1, c2)
-    return xor_bytes(x[pos: pos + len(crib)], crib)
+    end = pos + len(crib)
+    return xor_bytes(xor_bytes(c1[pos:end], c2[pos:end]), crib)
+
+@dataclass(frozen=True)
+class CribHit:
+    message: int       # ciphertext the crib was placed in
+    position: int
+    score: float       # mean BYTE_LOGP_EN of all messages' bytes in the window (English ≈ -1.3)
+    keystream: bytes   # keystream window implied by the placement
+
+@dataclass(frozen=True)
+class PartialKeystream:
+    keystream: bytes   # 0 where unknown
+    known: bytes       # 1 where the keystream byte is known
+
+    def decrypt(self, ciphertext: bytes, fill: int = ord("?")) -> bytes:
+        """Plaintext with `fill` wherever the keystream byte is unknown."""
+        n = min(len(ciphertext), len(self.keystream))
+        return bytes(c ^ k if m else fill for c, k, m in zip(ciphertext[:n], self.keystream, self.known)) \
+            + bytes([fill]) * (len(ciphertext) - n)
+
+class _Columns:
+    """Column statistics of ciphertexts aligned at offset 0 under one keystream."""
+
+    def __init__(self, ciphertexts: Sequence[bytes]):
+        self.cts = [bytes(c) for c in ciphertexts]
+        self.width = max(map(len, self.cts), default=0)
+        if np is not None:
+            lens = np.fromiter(map(len, self.cts), dtype=np.int64, count=len(self.cts))
+            flat = np.frombuffer(b"".join(self.cts), dtype=np.uint8)
+            cols = np.arange(flat.size) - np.repeat(np.cumsum(lens) - lens, lens)
+            hist = np.bincount(cols * 256 + flat, minlength=self.width * 256).reshape(self.width, 256)
+            self.key_scores = hist @ xor_score_matrix()  # [column, key byte]
+            self.depth = hist.sum(axis=1)                # messages covering each column
+            self.flat, self.cols, self.lens = flat, cols, lens
+        else:
+            self.depth = [0] * self.width
+            for c in self.cts:
+                for q in range(len(c)):
+                    self.depth[q] += 1
+            self._hists = [dict() for _ in range(self.width)]
+            for c in self.cts:
+                for q, b in enumerate(c):
+                    self._hists[q][b] = self._hists[q].get(b, 0) + 1
+            self._cache: dict[tuple[int, int], float] = {}
+
+    def score(self, q: int, k: int) -> float:
+        """Log-likelihood of column q decrypted with keystream byte k (pure-Python path, memoized)."""
+        s = self._cache.get((q, k))
+        if s is None:
+            s = self._cache[(q, k)] = sum(h * BYTE_LOGP_EN[b ^ k] for b, h in self._hists[q].items())
+        return s
+
+def _drag_numpy(cols: _Columns, crib: bytes):
+    """
+    (message, position, score, keystream rows) of every placement, vectorized
+    over all messages; None when the crib is longer than all ciphertext.
+    """
+    w = len(crib)
+    flat, col = cols.flat, cols.cols
+    n = flat.size - w + 1
+    if n <= 0:
+        return None
+    # windows over the concatenated ciphertexts; keep those inside one message
+    valid = np.flatnonzero(col[:n] + w <= np.repeat(cols.lens, cols.lens)[:n])
+    key = np.lib.stride_tricks.sliding_window_view(flat, w)[valid] ^ np.frombuffer(crib, dtype=np.uint8)
+    q = col[valid][:, None] + np.arange(w)
+    score = cols.key_scores[q, key].sum(axis=1) / cols.depth[q].sum(axis=1)
+    msg = np.repeat(np.arange(len(cols.lens)), cols.lens)[valid]
+    return msg, col[valid], score, key
+
+def drag_crib(ciphertexts: Sequence[bytes], crib: bytes, top: Optional[int] = 20,
+              min_score: Optional[float] = None) -> list[CribHit]:
+    """
+    Try `crib` at every position of every ciphertext (all sharing one keystream
+    from offset 0). A placement implies keystream = ciphertext ⊕ crib there; its
+    score is the mean English byte log-likelihood of every message decrypted
+    with that window. Returns the best `top` placements (all if None) scoring
+    at least min_score, best first; placements implying the same keystream
+    window (the crib in several messages at one position) are reported once.
+    """
+    if not crib:
+        raise ValidationError("crib must be non-empty")
+    cols = _Columns(ciphertexts)
+    w = len(crib)
+    hits: list[CribHit] = []
+    if np is not None:
+        found = _drag_numpy(cols, crib)
+        if found is None:
+            return []
+        msg, pos, score, key = found
+        keep = np.arange(len(score)) if min_score is None else np.flatnonzero(score >= min_score)
+        order = keep[np.argsort(-score[keep], kind="stable")]
+        ranked = (CribHit(int(msg[i]), int(pos[i]), float(score[i]), key[i].tobytes()) for i in order)
+    else:
+        for m, c in enumerate(cols.cts):
+            for p in range(len(c) - w + 1):
+                key = xor_bytes(c[p:p + w], crib)
+                s = sum(cols.score(p + t, k) for t, k in enumerate(key)) / sum(cols.depth[p:p + w])
+                if min_score is None or s >= min_score:
+                    hits.append(CribHit(m, p, s, key))
+        hits.sort(key=lambda h: -h.score)
+        ranked = iter(hits)
+    out, seen = [], set()
+    for h in ranked:
+        if top is not None and len(out) >= top:
+            break
+        if (h.position, h.keystream) not in seen:
+            seen.add((h.position, h.keystream))
+            out.append(h)
+    return out
+
+def recover_keystream(ciphertexts: Sequence[bytes], cribs: Iterable[bytes],
+                      min_score: float = -2.0, top: int = 20) -> PartialKeystream:
+    """
+    Drag every crib and fill a partial keystream from the hits scoring at
+    least min_score, best first; a hit that disagrees with bytes already
+    placed is skipped.
+    """
+    cts = [bytes(c) for c in ciphertexts]
+    width = max(map(len, cts), default=0)
+    ks, known = bytearray(width), bytearray(width)
+    hits = [h for crib in cribs for h in drag_crib(cts, crib, top, min_score)]
+    for h in sorted(hits, key=lambda h: -h.score):
+        span = range(h.position, h.position + len(h.keystream))
+        if any(known[q] and ks[q] != k for q, k in zip(span, h.keystream)):
+            continue
+        for q, k in zip(span, h.keystream):
+            ks[q], known[q] = k, 1
+    return PartialKeystream(bytes(ks), bytes(known))
@@ -0,0 +1,232 @@
+"""
+Ciphertext-only Playfair attack: simulated annealing over 5×5 squares.
+
+Playfair decryption depends only on where the two letters sit in the square,
+so one key-independent table maps a pair of cell positions to the pair of
+plaintext cell positions (DEC_POS). A candidate square is then just `sq`
+(cell -> letter) and `pos` (letter -> cell); every mutation swaps cells in
+place and patches `pos` for the letters it moved, and each fitness evaluation
+is a few gathers plus one quadgram sum. Independent restarts run in a process
+pool against a shared wall-clock deadline.
+"""
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from operator import add, mul
+from typing import Optional, Tuple
+
+from cryptolib.classical.playfair.helpers import ALPH_NO_J, build_square
+from cryptolib.classical.playfair.playfair import compile_key
+from cryptolib.cryptanalysis.scoring import QuadgramScorer, default_scorer
+from cryptolib.exceptions import ValidationError
+from cryptolib.text import clean_i_bytes
+
+try:
+    import numpy as np
+except ImportError:  # optional speed-up
+    np = None
+
+A0 = ord("A")
+
+def _dec_pos_tables() -> Tuple[bytes, bytes]:
+    """Cell pair i*25 + j -> plaintext cells (DEC_POS1[.], DEC_POS2[.]), same rules as playfair.decrypt."""
+    d1, d2 = bytearray(625), bytearray(625)
+    for i in range(25):
+        ri, ci = divmod(i, 5)
+        for j in range(25):
+            rj, cj = divmod(j, 5)
+            if ri == rj:         # same row -> left
+                a, b = ri * 5 + (ci - 1) % 5, rj * 5 + (cj - 1) % 5
+            elif ci == cj:       # same column -> up
+                a, b = (ri - 1) % 5 * 5 + ci, (rj - 1) % 5 * 5 + cj
+            else:                # rectangle -> swap columns
+                a, b = ri * 5 + cj, rj * 5 + ci
+            d1[i * 25 + j], d2[i * 25 + j] = a, b
+    return bytes(d1), bytes(d2)
+
+DEC_POS1, DEC_POS2 = _dec_pos_tables()
+
+class _Candidate:
+    """Mutable square (sq: cell -> letter digit, pos: letter digit -> cell) bound to one ciphertext."""
+
+    def __init__(self, cipher: bytes, square: str, scorer: QuadgramScorer):
+        self.scorer = scorer
+        self.sq = bytearray(ord(ch) - A0 for ch in square)
+        self.pos = bytearray(26)
+        for i, d in enumerate(self.sq):
+            self.pos[d] = i
+        self.ca, self.cb = cipher[0::2], cipher[1::2]
+        if np is not None:
+            self._np_ca = np.frombuffer(self.ca, dtype=np.uint8).astype(np.intp)
+            self._np_cb = np.frombuffer(self.cb, dtype=np.uint8).astype(np.intp)
+            self._np_sq = np.frombuffer(self.sq, dtype=np.uint8)    # live views of sq / pos
+            self._np_pos = np.frombuffer(self.pos, dtype=np.uint8)
+            self._dec1 = np.frombuffer(DEC_POS1, dtype=np.uint8)
+            self._dec2 = np.frombuffer(DEC_POS2, dtype=np.uint8)
+            self._plain = np.empty(len(cipher), dtype=np.uint8)
+
+    @property
+    def square(self) -> str:
+        return bytes(d + A0 for d in self.sq).decode("ascii")
+
+    def decrypt_digits(self):
+        """Plaintext letter digits under the current square (uint8 array, or bytearray without NumPy)."""
+        if np is not None:
+            p = self._np_pos.astype(np.intp)
+            idx = p[self._np_ca] * 25 + p[self._np_cb]
+            self._plain[0::2] = self._np_sq[self._dec1[idx]]
+            self._plain[1::2] = self._np_sq[self._dec2[idx]]
+            return self._plain
+        pos, sq = self.pos, self.sq
+        idx = list(map(add, map(mul, map(pos.__getitem__, self.ca), repeat(25)), map(pos.__getitem__, self.cb)))
+        plain = bytearray(2 * len(idx))
+        plain[0::2] = bytes(map(sq.__getitem__, map(DEC_POS1.__getitem__, idx)))
+        plain[1::2] = bytes(map(sq.__getitem__, map(DEC_POS2.__getitem__, idx)))
+        return plain
+
+    def score(self) -> float:
+        return self.scorer.score_digits(self.decrypt_digits())
+
+    # --- in-place, self-inverse mutations (apply twice to undo) ---
+
+    def swap(self, i: int, j: int) -> None:
+        sq, pos = self.sq, self.pos
+        a, b = sq[i], sq[j]
+        sq[i], sq[j] = b, a
+        pos[a], pos[b] = j, i
+
+    def swap_rows(self, r1: int, r2: int) -> None:
+        for c in range(5):
+            self.swap(r1 * 5 + c, r2 * 5 + c)
+
+    def swap_cols(self, c1: int, c2: int) -> None:
+        for r in range(0, 25, 5):
+            self.swap(r + c1, r + c2)
+
+    def flip_rows(self) -> None:
+        self.swap_rows(0, 4)
+        self.swap_rows(1, 3)
+
+    def flip_cols(self) -> None:
+        self.swap_cols(0, 4)
+        self.swap_cols(1, 3)
+
+    def reverse(self) -> None:
+        for i in range(12):
+            self.swap(i, 24 - i)
+
+    def random_move(self, rng: random.Random):
+        """
+        Pick a mutation (move, args): mostly single-cell swaps, occasionally
+        row/column/square moves. Every move undoes itself: move(*args) twice
+        is a no-op.
+        """
+        r = rng.random()
+        if r < 0.9:
+            return self.swap, rng.sample(range(25), 2)
+        if r < 0.94:
+            return self.swap_rows, rng.sample(range(5), 2)
+        if r < 0.98:
+            return self.swap_cols, rng.sample(range(5), 2)
+        return rng.choice((self.flip_rows, self.flip_cols, self.reverse)), ()
+
+def _cipher_digits(ciphertext: str) -> bytes:
+    c = clean_i_bytes(ciphertext)
+    if len(c) < 2:
+        raise ValidationError("Need at least one A–Z digraph of Playfair ciphertext")
+    if len(c) % 2:
+        c += b"X"  # as playfair.decrypt
+    return bytes(ch - A0 for ch in c)
+
+def _random_square(rng: random.Random) -> str:
+    letters = list(ALPH_NO_J)
+    rng.shuffle(letters)
+    return "".join(letters)
+
+def start_temperature(n_letters: int) -> float:
+    """
+    Starting temperature for log10 quadgram totals. The correct square stops
+    being stable near 0.06 per letter; starting just below that lets the chain
+    wander without melting.
+    """
+    return max(5.0, 0.05 * n_letters)
+
+def anneal(ciphertext: str, square: Optional[str] = None, *, scorer: Optional[QuadgramScorer] = None,
+           seed: Optional[int] = None, temp: Optional[float] = None, step: float = 0.2,
+           per_temp: int = 10_000, deadline: Optional[float] = None) -> Tuple[float, str]:
+    """
+    One annealing run from `square` (a key; random if None), cooling from temp
+    by step every per_temp mutations. Stops early at `deadline` (time.time(),
+    checked between temperature steps).
+    Returns (best score, best 25-letter square).
+    """
+    scorer = scorer or default_scorer()
+    rng = random.Random(seed)
+    c = _cipher_digits(ciphertext)
+    cand = _Candidate(c, build_square(square) if square else _random_square(rng), scorer)
+    cur = best = cand.score()
+    best_sq = cand.square
+    T = start_temperature(len(c)) if temp is None else temp
+    while T > 0:
+        if deadline is not None and time.time() >= deadline:
+            break
+        for _ in range(per_temp):
+            move, args = cand.random_move(rng)
+            move(*args)
+            s = cand.score()
+            d = s - cur
+            if d >= 0 or rng.random() < math.exp(d / T):
+                cur = s
+                if cur > best:
+                    best, best_sq = cur, cand.square
+            else:
+                move(*args)
+        T -= step
+    return best, best_sq
+
+def _restart_worker(ciphertext: str, scorer: Optional[QuadgramScorer], seed: int,
+                    budget: float, deadline: float, per_temp: int) -> Tuple[float, str]:
+    """
+    Back-to-back annealing runs from random squares for `budget` seconds from
+    when the chain starts (never past `deadline`); best result.
+    """
+    deadline = min(time.time() + budget, deadline)
+    rng = random.Random(seed)
+    best, best_sq = -math.inf, ""
+    while True:
+        sc, sq = anneal(ciphertext, scorer=scorer, seed=rng.getrandbits(64),
+                        per_temp=per_temp, deadline=deadline)
+        if sc > best:
+            best, best_sq = sc, sq
+        if time.time() >= deadline:
+            return best, best_sq
+
+def crack(ciphertext: str, *, time_budget: float = 60.0, restarts: Optional[int] = None,
+          max_workers: Optional[int] = None, scorer: Optional[QuadgramScorer] = None,
+          seed: Optional[int] = None, per_temp: int = 10_000) -> Tuple[str, str]:
+    """
+    Return (square, plaintext) of the best key found within time_budget seconds.
+    `restarts` independent annealing chains (default: one per worker) run in a
+    process pool; the square is a valid key for playfair.decrypt. Chains beyond
+    the worker count run in later waves, so each chain gets an equal share of
+    the budget (time_budget / number of waves). Pass a model from
+    scoring.load_model to share one mmapped table across the workers.
+    """
+    _cipher_digits(ciphertext)  # validate before spawning workers
+    workers = max_workers or os.cpu_count() or 1
+    restarts = restarts or workers
+    slots = 1 if workers == 1 or restarts == 1 else min(workers, restarts)
+    budget = time_budget / -(-restarts // slots)
+    deadline = time.time() + time_budget
+    base = random.Random(seed).getrandbits(32)
+    args = [(ciphertext, scorer, base + i, budget, deadline, per_temp) for i in range(restarts)]
+    if workers == 1 or restarts == 1:
+        results = [_restart_worker(*a) for a in args]
+    else:
+        with ProcessPoolExecutor(max_workers=slots) as pool:
+            results = list(pool.map(_restart_worker, *zip(*args)))
+    _, square = max(results)
+    return square, compile_key(square).decrypt(ciphertext)
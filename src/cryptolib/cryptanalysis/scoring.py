@@ -0,0 +1,219 @@
+"""
+Quadgram language model shared by the classical attacks.
+
+The model is a flat table of 26**4 float32 log10 probabilities, indexed by the
+base-26 code of a quadgram. A text scores the sum over its quadgrams (higher =
+more English-like): one gather-and-sum over its integer-coded letters. Hill
+climbers rescore only the quadgrams overlapping the positions they change.
+
+Models trained on other corpora (see corpus.py) are saved as a 32-byte header
+plus the raw little-endian float32 table, and loaded with mmap: no parse step,
+and every process scoring with the same file shares one copy in the page cache.
+"""
+import mmap
+import os
+import struct
+import sys
+from array import array
+from functools import lru_cache
+from itertools import repeat
+from math import log10
+from operator import add, mul
+from typing import Iterable, Optional, Sequence, Union
+
+from cryptolib.cryptanalysis.corpus import NgramCounter, count_file, count_text
+from cryptolib.text import ALPH, TextLike, clean_bytes
+
+try:
+    import numpy as np
+except ImportError:  # optional speed-up
+    np = None
+
+N_QUAD = 26 ** 4
+
+# model file header: magic, table entries, quadgrams trained on (padded to 32 bytes)
+MODEL_MAGIC = b"CQG1"
+_HEADER = struct.Struct("<4sIQ16x")
+
+# interpolation weights: quadgram, trigram x bigram-successor, unigram product
+WEIGHTS = (0.80, 0.15, 0.05)
+
+_TO_DIGITS = bytes.maketrans(ALPH, bytes(range(26)))
+_FROM_DIGITS = bytes.maketrans(bytes(range(26)), ALPH)
+# _ROTATE[k]: digit d -> (d + k) % 26
+_ROTATE = [bytes.maketrans(bytes(range(26)), bytes((d + k) % 26 for d in range(26))) for k in range(26)]
+
+def encode(text: TextLike) -> bytearray:
+    """Clean A-Z letters as digits 0..25, in a mutable buffer (for rescore)."""
+    return bytearray(clean_bytes(text).translate(_TO_DIGITS))
+
+def decode(digits) -> str:
+    """Inverse of encode."""
+    return bytes(digits).translate(_FROM_DIGITS).decode("ascii")
+
+def rotate_digits(digits, k: int) -> bytes:
+    """Digits shifted by k (mod 26): a Caesar shift in the digit domain."""
+    return bytes(digits).translate(_ROTATE[k % 26])
+
+def _quad_codes(d: bytes) -> Iterable[int]:
+    # code = ((d0*26 + d1)*26 + d2)*26 + d3, rolled like NgramIndex
+    c2 = map(add, map(mul, d, repeat(26)), d[1:])
+    c3 = map(add, map(mul, c2, repeat(26)), d[2:])
+    return map(add, map(mul, c3, repeat(26)), d[3:])
+
+def log_table(counts: Sequence[Sequence[int]]):
+    """
+    Smoothed log10 quadgram probabilities from 1- to 4-gram counts, as a flat
+    float32 table. Unseen quadgrams back off to P(abc)·P(d|c) and to the unigram
+    product, so a small training text still ranks rare sequences sensibly.
+    """
+    c1, c2, c3, c4 = counts
+    w4, w3, w1 = WEIGHTS
+    n1, n3, n4 = sum(c1), max(sum(c3), 1), max(sum(c4), 1)
+    if np is not None:
+        c1, c2, c3, c4 = (np.asarray(c, dtype=np.float64) for c in counts)
+        p1 = (c1 + 0.5) / (n1 + 13.0)
+        succ = (c2.reshape(26, 26) + p1) / (c1[:, None] + 1.0)  # P(d | c)
+        p = w4 * c4.reshape(26, 26, 26, 26) / n4
+        p += w3 * (c3 / n3).reshape(26, 26, 26, 1) * succ
+        p += w1 * np.einsum("a,b,c,d->abcd", p1, p1, p1, p1)
+        return np.log10(p).astype(np.float32).ravel()
+    p1 = [(c + 0.5) / (n1 + 13.0) for c in c1]
+    succ = [(c2[i] + p1[i % 26]) / (c1[i // 26] + 1.0) for i in range(26 * 26)]
+    table = array("f", bytes(4 * N_QUAD))
+    for abc in range(26 ** 3):
+        a, bc = divmod(abc, 676)
+        b, c = divmod(bc, 26)
+        tri = w3 * c3[abc] / n3
+        uni = w1 * p1[a] * p1[b] * p1[c]
+        base = abc * 26
+        for d in range(26):
+            table[base + d] = log10(w4 * c4[base + d] / n4 + tri * succ[c * 26 + d] + uni * p1[d])
+    return table
+
+class QuadgramScorer:
+    """
+    Fitness function over a 26**4 log-probability table. Accepts a NumPy array
+    or any float32 buffer (array('f'), bytes, mmap); buffers are used without copying.
+    """
+
+    def __init__(self, table):
+        if np is not None:
+            self.table = table.astype(np.float32, copy=False) if isinstance(table, np.ndarray) \
+                else np.frombuffer(table, dtype=np.float32)
+        else:
+            self.table = memoryview(table).cast("B").cast("f")
+        if len(self.table) != N_QUAD:
+            raise ValueError(f"quadgram table must have 26**4 = {N_QUAD} entries")
+        self.path: Optional[str] = None  # model file, when loaded with load_model
+
+    def __reduce__(self):
+        # file-backed models travel as their path and are re-mapped by the receiver
+        if self.path is not None:
+            return load_model, (self.path,)
+        return QuadgramScorer, (memoryview(self.table).tobytes(),)
+
+    @classmethod
+    def from_text(cls, text: TextLike) -> "QuadgramScorer":
+        """Train a model on a sample text."""
+        return cls(log_table(count_text(text)))
+
+    def score_digits(self, digits) -> float:
+        """Total log10 probability of a digit-encoded text (see encode)."""
+        if len(digits) < 4:
+            return 0.0
+        if np is not None:
+            a = np.frombuffer(digits, dtype=np.uint8).astype(np.intp)
+            idx = ((a[:-3] * 26 + a[1:-2]) * 26 + a[2:-1]) * 26 + a[3:]
+            return float(self.table[idx].sum(dtype=np.float64))
+        return sum(map(self.table.__getitem__, _quad_codes(bytes(digits))))
+
+    def score(self, text: TextLike) -> float:
+        """Total log10 probability of the clean letters of text."""
+        return self.score_digits(encode(text))
+
+    def fitness(self, text: TextLike) -> float:
+        """Mean log10 probability per quadgram, comparable across text lengths."""
+        d = encode(text)
+        return self.score_digits(d) / max(len(d) - 3, 1)
+
+    def _sum_at(self, d, starts) -> float:
+        if np is not None and len(starts) > 32:
+            s = np.asarray(starts, dtype=np.intp)
+            a = np.frombuffer(d, dtype=np.uint8).astype(np.intp)
+            idx = ((a[s] * 26 + a[s + 1]) * 26 + a[s + 2]) * 26 + a[s + 3]
+            return float(self.table[idx].sum(dtype=np.float64))
+        t = self.table
+        return sum(float(t[((d[s] * 26 + d[s + 1]) * 26 + d[s + 2]) * 26 + d[s + 3]]) for s in starts)
+
+    def rescore(self, digits: bytearray, total: float, positions: Iterable[int], values: Iterable[int]) -> float:
+        """
+        Set digits[p] = v for each (p, v) in place and return the updated total,
+        rescoring only the quadgrams that overlap a changed position.
+        """
+        if not isinstance(positions, range):
+            positions = list(positions)
+        if 4 * len(positions) >= len(digits):
+            # the changes touch (almost) every quadgram: one full pass is cheaper
+            _assign(digits, positions, values)
+            return self.score_digits(digits)
+        starts = _starts(positions, len(digits) - 4)
+        before = self._sum_at(digits, starts)
+        _assign(digits, positions, values)
+        return total - before + self._sum_at(digits, starts)
+
+def _assign(digits: bytearray, positions, values) -> None:
+    if isinstance(positions, range) and positions.step > 0:
+        digits[positions.start:positions.stop:positions.step] = bytes(values)
+    else:
+        for p, v in zip(positions, values):
+            digits[p] = v
+
+def _starts(positions, last: int):
+    """Sorted start offsets of every quadgram containing one of positions."""
+    if np is not None and len(positions) > 32:
+        s = (np.asarray(positions, dtype=np.intp)[:, None] - np.arange(4)).ravel()
+        return np.unique(s[(s >= 0) & (s <= last)])
+    return sorted({s for p in positions for s in range(max(p - 3, 0), min(p, last) + 1)})
+
+@lru_cache(maxsize=1)
+def default_scorer() -> QuadgramScorer:
+    """English model trained on the bundled public-domain sample (built once per process)."""
+    from cryptolib.cryptanalysis._english_sample import TEXT
+    return QuadgramScorer.from_text(TEXT)
+
+def save_model(path: Union[str, os.PathLike], counts: Union[NgramCounter, Sequence[Sequence[int]]]) -> None:
+    """Write the smoothed log table for 1..4-gram counts as a model file."""
+    if isinstance(counts, NgramCounter):
+        counts = counts.counts()
+    table = array("f", log_table(counts))
+    if sys.byteorder != "little":
+        table.byteswap()
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MODEL_MAGIC, N_QUAD, sum(counts[3])))
+        f.write(table)
+
+def train_model(corpus_paths: Iterable[Union[str, os.PathLike]], model_path: Union[str, os.PathLike],
+                chunk_size: int = 1 << 20) -> None:
+    """Stream one or more plain-text corpora from disk and write their model file."""
+    counter = NgramCounter()
+    for p in corpus_paths:
+        count_file(p, chunk_size, counter)
+    save_model(model_path, counter)
+
+def load_model(path: Union[str, os.PathLike]) -> QuadgramScorer:
+    """
+    Map a model file read-only and score straight from the mapping. The scorer
+    pickles as its path, so process pools re-map the file instead of copying it.
+    """
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if len(mm) != _HEADER.size + 4 * N_QUAD or _HEADER.unpack_from(mm)[:2] != (MODEL_MAGIC, N_QUAD):
+        raise ValueError(f"{os.fspath(path)!r} is not a quadgram model file")
+    body = memoryview(mm)[_HEADER.size:]
+    if sys.byteorder != "little":
+        body = array("f", body.tobytes())
+        body.byteswap()
+    scorer = QuadgramScorer(body)
+    scorer.path = os.fspath(path)
+    return scorer
@@ -1,76 +1,151 @@
-# Kasiski + (fallback) IOC + per-column chi-square to recover key & plaintext
-from collections import defaultdict
-from math import gcd
-from typing import List, Tuple
+# IOC period ranking (+ Kasiski hint) + per-column chi-square to recover key & plaintext
+from math import lcm
+from typing import List, Optional, Tuple
+from cryptolib.classical.shift import apply_shifts
+from cryptolib.cryptanalysis.frequency import (  # FREQ_EN re-exported
+    FREQ_EN, _column_counts_numpy, best_shift, chisq_counts, column_counts, ioc_counts, rotate,
+)
+from cryptolib.cryptanalysis.ngrams import NgramIndex
+from cryptolib.cryptanalysis.scoring import QuadgramScorer, encode, rotate_digits
 from cryptolib.exceptions import ValidationError
+from cryptolib.text import clean_bytes
+
+try:
+    import numpy as np
+except ImportError:  # optional speed-up
+    np = None
 
 ALPH = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
 A0 = ord("A")
+MAX_MODULUS = 1 << 12  # residue classes counted in one shared pass
 
-# English letter frequencies (%) — same table used for Caesar attack
-FREQ_EN = [
-    8.167, 1.492, 2.782, 4.253, 12.702, 2.228, 2.015, 6.094, 6.966, 0.153,
-    0.772, 4.025, 2.406, 6.749, 7.507, 1.929, 0.095, 5.987, 6.327, 9.056,
-    2.758, 0.978, 2.360, 0.150, 1.974, 0.074,
-]
-
-def _clean(s: str) -> str:
-    return "".join(ch for ch in s.upper() if "A" <= ch <= "Z")
-
-def _chisq(s: str) -> float:
-    n = len(s)
-    if n == 0:
-        return float("inf")
-    obs = [0] * 26
-    for ch in s:
-        obs[ord(ch) - A0] += 1
-    score = 0.0
-    for i in range(26):
-        exp = n * (FREQ_EN[i] / 100.0)
-        if exp <= 1e-12:
-            continue
-        diff = obs[i] - exp
-        score += (diff * diff) / exp
-    return score
-
-def _shift_clean(s: str, k: int) -> str:
-    # shift already-clean A-Z string by k (mod 26)
-    return "".join(ALPH[(ord(c) - A0 + k) % 26] for c in s)
-
-def kasiski_lengths(cipher: str, min_len: int = 3, max_len: int = 5) -> List[int]:
-    """Return candidate key lengths from Kasiski (divisors of repeated trigram distances)."""
-    s = _clean(cipher)
-    pos = defaultdict(list)
-    for L in range(min_len, max_len + 1):
-        for i in range(len(s) - L + 1):
-            pos[s[i: i + L]].append(i)
-    dists: List[int] = []
-    for inds in pos.values():
-        if len(inds) >= 2:
-            for i in range(1, len(inds)):
-                dists.append(inds[i] - inds[i - 1])
-                
-    if not dists:
-        return []
-    g = 0
-    for d in dists:
-        g = gcd(g, d)
-    # return all divisors of g, filtered to sensible sizes
-    return [k for k in range(1, g + 1) if g % k == 0]
-
-def _best_shift_for_column(col: str) -> int:
-    """Return the shift k (0..25) that makes this column most like English."""
-    best_k, best_score = 0, float("inf")
-    for k in range(26):
-        sc = _chisq(_shift_clean(col, -k))  # decrypt with shift k, score
-        if sc < best_score:
-            best_k, best_score = k, sc
-    return best_k
+def kasiski_lengths(cipher: str, min_len: int = 3, max_len: int = 5, max_period: int = 40) -> List[int]:
+    """
+    Candidate key lengths from Kasiski examination, most likely first: factors of
+    repeated n-gram distances that occur more often than chance (see NgramIndex).
+    """
+    return [f for f, _ in NgramIndex(cipher, min_len, max_len).factor_histogram(max_period)]
+
+def _shared_modulus(m: int, hi: int, cap: int, moduli: List[int]) -> int:
+    """
+    lcm of m and, greedily, the later periods up to hi that no earlier modulus
+    covers, as long as it stays within cap.
+    """
+    L = m
+    for p in range(m + 1, hi + 1):
+        if all(M % p for M in moduli) and lcm(L, p) <= cap:
+            L = lcm(L, p)
+    return L
+
+def _residue_counts(s: bytes, L: int):
+    """(i mod L, letter) histogram of clean A-Z bytes: an L × 26 array (or lists)."""
+    return _column_counts_numpy(s, L) if np is not None else column_counts(s, L)
+
+def _fold_columns(residues, L: int, m: int) -> List[List[int]]:
+    """Column histograms for a period m dividing L: column c sums residues c, c + m, ..."""
+    if np is not None:
+        return residues.reshape(L // m, m, 26).sum(axis=0).tolist()
+    return [[sum(x) for x in zip(*residues[c::m])] for c in range(m)]
+
+def _ioc_scan(s: bytes, max_period: int, stop_ioc: float, stop_ratio: float):
+    """
+    Average column IOC for periods 1..max_period (column histograms kept for reuse).
+    Counts are shared: one pass over the text counts (i mod L, letter) for an
+    L divisible by a whole block of periods (at most MAX_MODULUS, or the text
+    length if shorter), and each period's columns are folded from that table;
+    a new pass is made only for a period no earlier L covers.
+    Stops early once a period reaches stop_ioc and beats the mean of the smaller
+    periods by stop_ratio: its multiples would only score about the same.
+    Returns (scores {period: ioc}, column histograms {period: cols}, stopped_early).
+    """
+    scores: dict[int, float] = {}
+    cols_by_period: dict[int, List[List[int]]] = {}
+    hi = max(1, min(max_period, len(s) // 2))
+    cap = max(hi, min(MAX_MODULUS, len(s)))
+    tables: dict[int, object] = {}  # modulus L -> its residue histogram
+    for m in range(1, hi + 1):
+        L = next((M for M in tables if M % m == 0), None)
+        if L is None:
+            L = _shared_modulus(m, hi, cap, list(tables))
+            tables[L] = _residue_counts(s, L)
+        cols = _fold_columns(tables[L], L, m)
+        cols_by_period[m] = cols
+        ioc = sum(map(ioc_counts, cols)) / m
+        baseline = sum(scores.values()) / len(scores) if scores else 0.0
+        scores[m] = ioc
+        if ioc >= stop_ioc and ioc >= stop_ratio * baseline:
+            return scores, cols_by_period, True
+    return scores, cols_by_period, False
 
-def _decrypt_with_shifts(text: str, shifts: List[int]) -> str:
-    """Decrypt whole text using periodic shifts (index by i % len(shifts))."""
+def _rank_periods(scores: dict[int, float], tol: float = 0.9) -> List[int]:
+    """
+    Periods best IOC first, each replaced by its smallest divisor scoring at least
+    tol × as well: multiples of the true period score about the same (or slightly
+    higher, on shorter columns) and would only overfit the key search.
+    """
+    ranked: List[int] = []
+    for m in sorted(scores, key=lambda m: (-scores[m], m)):
+        base = min(d for d in scores if m % d == 0 and scores[d] >= tol * scores[m])
+        if base not in ranked:
+            ranked.append(base)
+    return ranked
+
+def estimate_periods(ciphertext: str, max_period: int = 40,
+                     stop_ioc: float = 0.06, stop_ratio: float = 1.3) -> List[Tuple[int, float]]:
+    """
+    Friedman/IOC period estimate: (period, average column IOC) pairs, most likely
+    first. English columns score ≈ 0.066, wrong periods ≈ 0.04.
+    """
+    s = clean_bytes(ciphertext)
+    if not s:
+        raise ValidationError("No A–Z letters in ciphertext to analyze")
+    scores, _, _ = _ioc_scan(s, max_period, stop_ioc, stop_ratio)
+    return [(m, scores[m]) for m in _rank_periods(scores)]
+
+def _key_for_period(cols: List[List[int]]) -> Tuple[float, List[int]]:
+    """Best per-column shifts for one period's column histograms, and the chi-square of the whole decryption."""
+    shifts = [best_shift(obs) for obs in cols]
+    # plaintext histogram = sum of the columns' histograms rotated by their shifts
+    total = [0] * 26
+    for obs, k in zip(cols, shifts):
+        total = [t + o for t, o in zip(total, rotate(obs, k))]
+    return chisq_counts(total), shifts
+
+def _decrypt_digits(cdig: bytes, shifts: List[int]) -> bytearray:
     m = len(shifts)
-    return "".join(ALPH[(ord(ch) - A0 - shifts[i % m]) % 26] for i, ch in enumerate(text))
+    plain = bytearray(len(cdig))
+    for r, k in enumerate(shifts):
+        plain[r::m] = rotate_digits(cdig[r::m], -k)
+    return plain
+
+def _refine_shifts(scorer: QuadgramScorer, cdig: bytes, shifts: List[int],
+                   sweeps: int = 3) -> Tuple[float, List[int]]:
+    """
+    Coordinate ascent on the key under the quadgram scorer: retry all 26 shifts
+    of one column at a time, rescoring only the quadgrams that column touches.
+    Returns (score, shifts).
+    """
+    m, n = len(shifts), len(cdig)
+    shifts = list(shifts)
+    plain = _decrypt_digits(cdig, shifts)
+    total = scorer.score_digits(plain)
+    for _ in range(sweeps):
+        improved = False
+        for r in range(m):
+            col, pos = cdig[r::m], range(r, n, m)
+            cur, best, best_k = total, total, shifts[r]
+            for k in range(26):
+                if k != shifts[r]:
+                    cur = scorer.rescore(plain, cur, pos, rotate_digits(col, -k))
+                    if cur > best + 1e-9:
+                        best, best_k = cur, k
+            scorer.rescore(plain, cur, pos, rotate_digits(col, -best_k))
+            improved |= best_k != shifts[r]
+            shifts[r] = best_k
+        total = scorer.score_digits(plain)  # resync: no float drift across sweeps
+        if not improved:
+            break
+    return total, shifts
 
 def _compress_repeating_shifts(shifts: List[int]) -> List[int]:
     """Shrink repeating keys: [M,A,G,N,U,M,M,A,G,N,U,M] -> [M,A,G,N,U,M]."""
@@ -80,31 +155,40 @@ def _compress_repeating_shifts(shifts: List[int]) -> List[int]:
             return shifts[:t]
     return shifts
 
-def crack(ciphertext: str) -> Tuple[str, str]:
+def crack(ciphertext: str, max_period: int = 40, top_k: int = 3,
+          scorer: Optional[QuadgramScorer] = None) -> Tuple[str, str]:
     """
-    Recover (key, plaintext) by testing candidate periods.
-    Picks the absolute best chi-square plaintext. Raises ValidationError if no A–Z letters.
+    Recover (key, plaintext): rank periods up to max_period by IOC, then run the
+    per-column chi-square key search on the top_k only (plus the top Kasiski hint
+    when no period clearly wins). Picks the best chi-square plaintext.
+    With a scorer (e.g. scoring.default_scorer()) each candidate key is refined
+    by quadgram hill climbing and the highest log-probability plaintext wins.
+    Raises ValidationError if no A–Z letters.
     """
-    s = _clean(ciphertext)
+    s = clean_bytes(ciphertext)
     if not s:
         raise ValidationError("No A–Z letters in ciphertext to analyze")
 
-    # candidate periods: small ones first, then Kasiski hints (dedup)
-    periods: List[int] = list(range(1, min(12, len(s)) + 1))
-    for m in kasiski_lengths(s):
-        if 1 <= m <= len(s) and m not in periods:
-            periods.append(m)
+    scores, cols_by_period, stopped = _ioc_scan(s, max_period, 0.06, 1.3)
+    periods = _rank_periods(scores)[:1 if stopped else top_k]
+    if not stopped:
+        for m in kasiski_lengths(s, max_period=max_period)[:1]:
+            if m not in periods:
+                periods.append(m)
 
-    best_score, best_shifts, best_plain = float("inf"), [], ""
+    best_score, best_shifts = float("inf"), [0]
+    cdig = bytes(encode(s)) if scorer is not None and len(s) >= 4 else None
 
     for m in periods:
-        cols = [s[r::m] for r in range(m)]
-        shifts = [_best_shift_for_column(col) for col in cols]
-        pt = _decrypt_with_shifts(s, shifts)
-        sc = _chisq(pt)
+        cols = cols_by_period.get(m) or column_counts(s, m)
+        sc, shifts = _key_for_period(cols)
+        if cdig is not None:
+            sc, shifts = _refine_shifts(scorer, cdig, shifts)
+            sc = -sc
         if sc < best_score:
-            best_score, best_shifts, best_plain = sc, shifts, pt
+            best_score, best_shifts = sc, shifts
 
+    best_plain = apply_shifts(s, tuple(-k % 26 for k in best_shifts)).decode("ascii")
     best_shifts = _compress_repeating_shifts(best_shifts)
     key = "".join(ALPH[k] for k in best_shifts)
     return key, best_plain
@@ -0,0 +1,180 @@
+"""
+Find the single-byte-XOR encrypted lines in large line-oriented dumps.
+
+Lines are processed a window at a time (CHUNK_SIZE bytes, cut at a newline;
+files are mmapped). Lines shorter than min_len are dropped, then ROW_BATCH
+lines at a time one bincount builds their byte histograms and one product
+with the 256 × 256 XOR score matrix rates all 256 keys of each. Only a
+bounded top-k heap survives between windows, so memory is O(CHUNK_SIZE)
+however short the lines, and does not grow with the file.
+"""
+import heapq
+import mmap
+import os
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterator, List, Union
+
+from cryptolib.cryptanalysis.frequency import xor_key_scores, xor_score_matrix
+
+try:
+    import numpy as np
+except ImportError:  # optional speed-up
+    np = None
+
+CHUNK_SIZE = 1 << 19  # bytes per window (extended to the next newline)
+ROW_BATCH = 1024      # lines scored per histogram × score-matrix product
+
+@dataclass(frozen=True)
+class LineHit:
+    line: int          # 0-based line number
+    offset: int        # byte offset of the line in the input
+    key: int
+    score: float       # mean log10 English likelihood per decrypted byte (English ≈ -1.3)
+    plaintext: bytes
+
+def _windows(view: memoryview, chunk_size: int) -> Iterator[tuple[int, memoryview]]:
+    """(offset, window) pieces of view, each ending just after a newline (or at the end)."""
+    raw = view.obj  # bytes, bytearray and mmap can search for newlines in place
+    if not hasattr(raw, "rfind") or len(raw) != len(view):
+        raw = view.tobytes()
+    start, n = 0, len(view)
+    while start < n:
+        end = min(start + chunk_size, n)
+        if end < n:
+            cut = raw.rfind(b"\n", start, end)
+            if cut < 0:  # one line longer than a window: extend to its end
+                cut = raw.find(b"\n", end)
+            end = n if cut < 0 else cut + 1
+        yield start, view[start:end]
+        start = end
+
+@lru_cache(maxsize=1)
+def _nibbles():
+    """ASCII -> hex digit value (NumPy LUT); 16 marks an invalid byte and 17 ignorable whitespace."""
+    lut = np.full(256, 16, dtype=np.uint8)
+    for i, ch in enumerate(b"0123456789abcdef"):
+        lut[ch] = i
+    for i, ch in enumerate(b"ABCDEF"):
+        lut[ch] = 10 + i
+    lut[list(b" \t\r")] = 17
+    return lut
+
+def _window_lines(buf, hexlines: bool):
+    """
+    Decoded bytes of every line in a window (NumPy): (flat bytes, line id per
+    byte, decoded length per line, offset of each line in the window, valid mask).
+    """
+    nl = np.flatnonzero(buf == 10)
+    starts = np.concatenate(([0], nl + 1))
+    if starts[-1] == len(buf):          # window ends with a newline
+        starts = starts[:-1]
+    n_lines = len(starts)
+    lid = np.cumsum(buf == 10) - (buf == 10)  # line id of each byte (newline counted to its line)
+    keep = buf != 10
+    if not hexlines:
+        flat, fid = buf[keep], lid[keep]
+        return flat, fid, np.bincount(fid, minlength=n_lines), starts, np.ones(n_lines, dtype=bool)
+    vals, fid = _nibbles()[buf[keep]], lid[keep]
+    bad = np.zeros(n_lines, dtype=bool)
+    if (vals >= 16).any():  # drop whitespace; lines with other non-hex bytes are skipped
+        digits = vals != 17
+        vals, fid = vals[digits], fid[digits]
+        bad |= np.bincount(fid, weights=vals == 16, minlength=n_lines) > 0
+    counts = np.bincount(fid, minlength=n_lines)
+    bad |= counts % 2 == 1
+    if bad.any():
+        good = ~bad[fid]
+        vals, fid = vals[good], fid[good]
+    # every remaining line is an even run of hex digits: pair them globally
+    flat = (vals[0::2] << 4) | vals[1::2]
+    return flat, fid[0::2], np.where(bad, 0, counts // 2), starts, ~bad
+
+def _score_window_numpy(window: memoryview, hexlines: bool, min_len: int, top: int):
+    """
+    (newlines in the window, [(score, line in window, offset in window, key,
+    plaintext)] of its best `top` lines). Only lines passing min_len are
+    histogrammed, ROW_BATCH at a time, so the n × 256 tables stay bounded.
+    """
+    buf = np.frombuffer(window, dtype=np.uint8)
+    flat, fid, lens, starts, valid = _window_lines(buf, hexlines)
+    newlines = int(np.count_nonzero(buf == 10))
+    lines = np.flatnonzero(valid & (lens >= min_len))
+    if not lines.size:
+        return newlines, []
+    # compact to the scored lines: their bytes, renumbered 0..len(lines)-1
+    rank = np.full(len(starts), -1, dtype=np.intp)
+    rank[lines] = np.arange(lines.size)
+    fid = rank[fid]
+    keep = fid >= 0
+    flat, fid, lens = flat[keep], fid[keep], lens[lines]
+    line_starts = np.concatenate(([0], np.cumsum(lens)))
+    best = np.empty(lines.size, dtype=np.float32)
+    keys = np.empty(lines.size, dtype=np.intp)
+    for lo in range(0, lines.size, ROW_BATCH):
+        hi = min(lo + ROW_BATCH, lines.size)
+        a, b = line_starts[lo], line_starts[hi]
+        hist = np.bincount((fid[a:b] - lo) * 256 + flat[a:b], minlength=(hi - lo) * 256)
+        scores = hist.reshape(hi - lo, 256).astype(np.float32) @ xor_score_matrix("float32")
+        keys[lo:hi] = scores.argmax(axis=1)
+        best[lo:hi] = scores[np.arange(hi - lo), keys[lo:hi]] / lens[lo:hi]
+    out = []
+    for i in np.argsort(-best, kind="stable")[:top].tolist():
+        data = flat[line_starts[i]:line_starts[i + 1]] ^ np.uint8(keys[i])
+        line = int(lines[i])
+        out.append((float(best[i]), line, int(starts[line]), int(keys[i]), data.tobytes()))
+    return newlines, out
+
+def _score_window_python(window: memoryview, hexlines: bool, min_len: int, top: int):
+    text = window.tobytes()
+    out, offset = [], 0
+    for line, raw in enumerate(text.split(b"\n")):
+        start, offset = offset, offset + len(raw) + 1
+        if not raw and start >= len(window):
+            break
+        try:
+            data = bytes.fromhex(raw.decode("ascii")) if hexlines else raw
+        except ValueError:
+            continue
+        if len(data) < min_len:
+            continue
+        c = Counter(data)
+        sc = xor_key_scores([c[b] for b in range(256)])
+        key = max(range(256), key=sc.__getitem__)
+        out.append((sc[key] / len(data), line, start, key, bytes(b ^ key for b in data)))
+    return text.count(b"\n"), heapq.nlargest(top, out, key=lambda t: t[0])
+
+def scan(data, top: int = 10, hexlines: bool = True, min_len: int = 16,
+         chunk_size: int = CHUNK_SIZE) -> List[LineHit]:
+    """
+    Rate every line of `data` (any buffer, e.g. an mmap) as single-byte XOR of
+    English under all 256 keys and return the `top` lines, best first. Lines
+    are hex strings (hexlines=True; malformed ones are skipped) or raw bytes;
+    lines shorter than min_len decoded bytes are ignored (any short line looks
+    like English under some key).
+    """
+    view = memoryview(data).cast("B")
+    score_window = _score_window_numpy if np is not None else _score_window_python
+    heap: list = []  # min-heap of the best `top` (score, -line, hit)
+    line_base = 0
+    for base, window in _windows(view, chunk_size):
+        newlines, best = score_window(window, hexlines, min_len, top)
+        for score, line, off, key, plain in best:
+            item = (score, -(line_base + line))
+            if len(heap) < top or item > heap[0][:2]:
+                hit = LineHit(line_base + line, base + off, key, score, plain)
+                if len(heap) < top:
+                    heapq.heappush(heap, (*item, hit))
+                else:
+                    heapq.heapreplace(heap, (*item, hit))
+        line_base += newlines
+    return [h for _, _, h in sorted(heap, reverse=True)]
+
+def scan_file(path: Union[str, os.PathLike], top: int = 10, **kwargs) -> List[LineHit]:
+    """scan() over a memory-mapped file."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return scan(mm, top, **kwargs)
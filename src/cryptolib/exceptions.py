@@ -2,3 +2,4 @@ class CryptolibError(Exception): ...
 class InvalidKeyError(CryptolibError): ...
 class NotInvertibleError(CryptolibError): ...
 class ValidationError(CryptolibError): ...
+class NonceLimitError(CryptolibError): ...
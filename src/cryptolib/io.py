@@ -0,0 +1,14 @@
+"""
+Shared helpers for the streaming (bounded-memory) file APIs.
+"""
+from typing import BinaryIO
+
+def readinto_full(f: BinaryIO, buf: memoryview) -> int:
+    """Fill buf from f (short reads retried); return bytes read (< len(buf) only at EOF)."""
+    got = 0
+    while got < len(buf):
+        n = f.readinto(buf[got:])
+        if not n:
+            break
+        got += n
+    return got
@@ -0,0 +1,101 @@
+"""
+Linear algebra modulo small integers.
+
+Systems mod a squarefree m are solved by Gaussian elimination mod each prime
+factor p (a field, so every non-zero pivot is invertible) and recombined with
+the CRT; this sidesteps zero divisors mod m (e.g. 2 and 13 mod 26).
+"""
+from typing import List, Optional, Sequence
+
+from cryptolib.exceptions import NotInvertibleError
+from .number import crt, modinv
+
+Matrix = List[List[int]]
+
+def prime_factors(m: int) -> List[int]:
+    """Distinct prime factors of m; ValueError unless m is squarefree and > 1."""
+    if m < 2:
+        raise ValueError("modulus must be >= 2")
+    out, d = [], 2
+    while d * d <= m:
+        if m % d == 0:
+            m //= d
+            if m % d == 0:
+                raise ValueError("modulus must be squarefree")
+            out.append(d)
+        d += 1
+    if m > 1:
+        out.append(m)
+    return out
+
+class RowBasis:
+    """
+    Incremental row-echelon basis of vectors in (Z/p)^n, p prime. Each row may
+    carry a payload (e.g. the right-hand side of A·X = B) that is reduced
+    alongside it; once n independent rows are in, solve() returns X.
+    """
+
+    def __init__(self, n: int, p: int):
+        self.n, self.p = n, p
+        self._rows: dict[int, tuple[list[int], list[int]]] = {}  # pivot column -> (row, payload)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @property
+    def full(self) -> bool:
+        return len(self._rows) == self.n
+
+    def add(self, vec: Sequence[int], payload: Sequence[int] = ()) -> bool:
+        """Reduce vec against the basis; keep it (True) if it is independent."""
+        p = self.p
+        v = [x % p for x in vec]
+        w = [y % p for y in payload]
+        for col in range(self.n):
+            f = v[col]
+            if not f:
+                continue
+            row = self._rows.get(col)
+            if row is None:
+                inv = modinv(f, p)
+                self._rows[col] = ([x * inv % p for x in v], [y * inv % p for y in w])
+                return True
+            r, rw = row
+            v = [(x - f * y) % p for x, y in zip(v, r)]
+            w = [(x - f * y) % p for x, y in zip(w, rw)]
+        return False
+
+    def solve(self) -> Matrix:
+        """Payloads after reducing the (full) basis to the identity: X with A·X = B."""
+        if not self.full:
+            raise NotInvertibleError(f"rows span only {len(self._rows)} of {self.n} dimensions mod {self.p}")
+        p = self.p
+        rows = {c: (list(r), list(w)) for c, (r, w) in self._rows.items()}
+        for c in range(self.n - 1, -1, -1):
+            r, w = rows[c]
+            for c2 in range(c):
+                r2, w2 = rows[c2]
+                f = r2[c]
+                if f:
+                    rows[c2] = ([(x - f * y) % p for x, y in zip(r2, r)],
+                                [(x - f * y) % p for x, y in zip(w2, w)])
+        return [rows[c][1] for c in range(self.n)]
+
+def solve_mod(A: Sequence[Sequence[int]], B: Sequence[Sequence[int]], m: int,
+              factors: Optional[Sequence[int]] = None) -> Matrix:
+    """
+    Solve A·X = B (mod m) for square A, m squarefree (pass `factors` to skip
+    factoring). Raises NotInvertibleError if A is singular modulo any prime factor of m.
+    """
+    factors = factors or prime_factors(m)
+    parts = []
+    for p in factors:
+        basis = RowBasis(len(A), p)
+        for a, b in zip(A, B):
+            basis.add(a, b)
+        parts.append(basis.solve())
+    return crt_matrix(parts, factors)
+
+def crt_matrix(parts: Sequence[Matrix], moduli: Sequence[int]) -> Matrix:
+    """Entry-wise CRT of equally shaped matrices, one per coprime modulus."""
+    return [[crt(vals, moduli) for vals in zip(*rows)] for rows in zip(*parts)]
@@ -1,4 +1,4 @@
-from typing import Tuple
+from typing import Sequence, Tuple
 from cryptolib.exceptions import NotInvertibleError
 
 def egcd(a: int, b: int) -> Tuple[int, int, int]:
@@ -53,4 +53,16 @@ def modexp(base: int, exp: int, mod: int) -> int:
             result = (result * b) % mod
         b = (b * b) % mod
         e >>= 1
-    return result
\ No newline at end of file
+    return result
+
+def crt(residues: Sequence[int], moduli: Sequence[int]) -> int:
+    """
+    Chinese remainder theorem: the x in [0, prod(moduli)) with x ≡ r_i (mod m_i).
+    Moduli must be pairwise coprime (NotInvertibleError otherwise).
+    """
+    x, M = 0, 1
+    for r, m in zip(residues, moduli):
+        # lift x (mod M) to the solution mod M*m
+        t = ((r - x) * modinv(M, m)) % m
+        x, M = x + M * t, M * m
+    return x % M
@@ -1,13 +1,89 @@
 import os
-from typing import Optional
+from itertools import count, repeat
+from typing import Iterable, Optional
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptolib.exceptions import NonceLimitError
 
 NONCE_LEN = 12 # 96-bit nonce as recommended for GCM
+PREFIX_LEN = 4 # AEADContext nonce = random fixed field || 64-bit invocation counter
+MAX_INVOCATIONS = 2 ** 32  # default per-context cap (SP 800-38D's limit for one key)
+
+def _check_nonce(nonce: bytes) -> None:
+    if len(nonce) != NONCE_LEN:
+        raise ValueError("AES-GCM nonce must be 12 bytes")
+
+def _with_aads(items: Iterable, aads: Optional[Iterable[Optional[bytes]]]):
+    """Pair items with aads; sized arguments are length-checked before any work starts."""
+    if aads is None:
+        return zip(items, repeat(None))
+    if hasattr(items, "__len__") and hasattr(aads, "__len__") and len(items) != len(aads):
+        raise ValueError(f"got {len(aads)} aads for {len(items)} items")
+    return zip(items, aads, strict=True)
+
+class AEADContext:
+    """
+    AES-GCM under one key for many messages: the AESGCM object is built once,
+    and nonces are a random 4-byte prefix followed by a 64-bit big-endian
+    counter (deterministic construction, SP 800-38D §8.2.1), so no nonce
+    repeats within a context. Encryption stops with NonceLimitError after
+    max_invocations messages; rekey or start a new context (new prefix) then.
+    Use one context per key and process, not one per message: prefixes are
+    random, so many contexts for one key risk a prefix collision.
+    """
+
+    def __init__(self, key: bytes, nonce_prefix: Optional[bytes] = None,
+                 max_invocations: int = MAX_INVOCATIONS):
+        self._aead = AESGCM(key)  # validates the key size once
+        prefix = os.urandom(PREFIX_LEN) if nonce_prefix is None else bytes(nonce_prefix)
+        if len(prefix) != PREFIX_LEN:
+            raise ValueError("nonce prefix must be 4 bytes")
+        if not 0 < max_invocations <= 2 ** 64:
+            raise ValueError("max_invocations must be in 1..2**64")
+        self.nonce_prefix = prefix
+        self.max_invocations = max_invocations
+        self._counter = count()  # next() is atomic under the GIL: safe across threads
+
+    def next_nonce(self) -> bytes:
+        """Reserve the next nonce; NonceLimitError once max_invocations are used."""
+        n = next(self._counter)
+        if n >= self.max_invocations:
+            raise NonceLimitError("AES-GCM invocation limit reached for this context; rekey")
+        return self.nonce_prefix + n.to_bytes(8, "big")
+
+    def encrypt(self, plaintext: bytes, aad: Optional[bytes] = None) -> tuple[bytes, bytes]:
+        """Returns (nonce, ciphertext_with_tag), like the module-level encrypt."""
+        nonce = self.next_nonce()
+        return nonce, self._aead.encrypt(nonce, plaintext, aad)
+
+    def decrypt(self, nonce: bytes, ciphertext_with_tag: bytes, aad: Optional[bytes] = None) -> bytes:
+        """Raises InvalidTag on tampering or wrong inputs."""
+        _check_nonce(nonce)
+        return self._aead.decrypt(nonce, ciphertext_with_tag, aad)
+
+    def encrypt_many(self, plaintexts: Iterable[bytes],
+                     aads: Optional[Iterable[Optional[bytes]]] = None) -> list[tuple[bytes, bytes]]:
+        """encrypt() over a batch (aads parallel to plaintexts, or None for all)."""
+        enc, nonce = self._aead.encrypt, self.next_nonce
+        out = []
+        for pt, aad in _with_aads(plaintexts, aads):
+            n = nonce()
+            out.append((n, enc(n, pt, aad)))
+        return out
+
+    def decrypt_many(self, items: Iterable[tuple[bytes, bytes]],
+                     aads: Optional[Iterable[Optional[bytes]]] = None) -> list[bytes]:
+        """
+        decrypt() over (nonce, ciphertext_with_tag) pairs. Nonce lengths are not
+        re-checked per item: a wrong nonce only fails authentication (InvalidTag).
+        """
+        dec = self._aead.decrypt
+        return [dec(n, ct, aad) for (n, ct), aad in _with_aads(items, aads)]
 
 def encrypt(key: bytes, plaintext: bytes, aad: Optional[bytes] = None) -> tuple[bytes, bytes]:
     """
     Encrypt with AES-GCM. Returns (nonce, ciphertext_with_tag).
-    Key must be 16/24/32 bytes (AES-128/192/256).
+    Key must be 16/24/32 bytes (AES-128/192/256). One-shot calls keep random
+    nonces; use AEADContext for many messages under one key.
     """
     nonce = os.urandom(NONCE_LEN)
     ct = AESGCM(key).encrypt(nonce, plaintext, aad)
@@ -17,6 +93,5 @@ def decrypt(key: bytes, nonce: bytes, ciphertext_with_tag: bytes, aad: Optional[
     """
     Decrypt with AES-GCM. Raises InvalidTag on tampering or wrong inputs.
     """
-    if len(nonce) != NONCE_LEN:
-        raise ValueError("AES-GCM nonce must be 12 bytes")
+    _check_nonce(nonce)
     return AESGCM(key).decrypt(nonce, ciphertext_with_tag, aad)
@@ -0,0 +1,117 @@
+"""
+Segmented streaming AEAD (the STREAM construction over AES-GCM) for inputs
+too large for memory.
+
+Layout: header (magic, segment size, 7-byte random nonce prefix), then one
+AES-GCM ciphertext (+16-byte tag) per segment of segment_size plaintext bytes;
+the last segment may be shorter or empty. Segment i is sealed under
+    nonce = prefix || i (4 bytes, big-endian) || last-segment flag (1 byte)
+with the header (and any caller aad) as associated data. Reordering or
+dropping segments changes the counter, cutting the stream at a segment
+boundary leaves a last segment sealed with flag 0, and a tampered header
+changes every segment's aad: all fail with InvalidTag.
+
+Segments go through two preallocated input buffers (the next one is read
+before the current one is sealed, to learn whether it is the last) and one
+output buffer, so memory is O(segment_size) for any stream length. The
+header is only authenticated by the first segment, so decryption refuses a
+segment size above max_segment_size (MAX_SEGMENT_SIZE by default) before
+allocating anything: a forged header cannot force huge buffers. Decryption
+writes each segment once it authenticates: output from a stream that then
+fails is partial and must be discarded.
+"""
+import os
+import struct
+from typing import BinaryIO, Optional
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptolib.exceptions import NonceLimitError, ValidationError
+from cryptolib.io import readinto_full
+from .aes_gcm import NONCE_LEN
+
+MAGIC = b"CLS1"
+TAG_LEN = 16
+PREFIX_LEN = NONCE_LEN - 5  # counter (4) + last flag (1) complete the GCM nonce
+SEGMENT_SIZE = 1 << 16
+MAX_SEGMENT_SIZE = 1 << 20  # largest segment decrypt_stream accepts by default
+MAX_SEGMENTS = 2 ** 32
+_HEADER = struct.Struct(">4sI7s")  # magic, segment size, nonce prefix
+_LAST = (b"\x00", b"\x01")
+
+def _nonce(prefix: bytes, i: int, last: bool) -> bytes:
+    if i >= MAX_SEGMENTS:
+        raise NonceLimitError("stream exceeds 2**32 segments; use a larger segment_size")
+    return prefix + i.to_bytes(4, "big") + _LAST[last]
+
+def _seal(aead: AESGCM, nonce: bytes, data: memoryview, aad: bytes, out: memoryview) -> None:
+    if hasattr(aead, "encrypt_into"):  # cryptography >= 45: no per-segment allocation
+        aead.encrypt_into(nonce, data, aad, out)
+    else:
+        out[:] = aead.encrypt(nonce, data, aad)
+
+def _open(aead: AESGCM, nonce: bytes, data: memoryview, aad: bytes, out: memoryview) -> None:
+    if len(data) < TAG_LEN:
+        raise InvalidTag()
+    if hasattr(aead, "decrypt_into"):
+        aead.decrypt_into(nonce, data, aad, out)
+    else:
+        out[:] = aead.decrypt(nonce, data, aad)
+
+def encrypt_stream(key: bytes, src: BinaryIO, dst: BinaryIO, aad: Optional[bytes] = None,
+                   segment_size: int = SEGMENT_SIZE) -> int:
+    """Encrypt src (readinto) to dst segment by segment; returns bytes written."""
+    if not 0 < segment_size < 2 ** 32 - TAG_LEN:
+        raise ValueError("segment_size must be in 1..2**32 - 17")
+    aead = AESGCM(key)
+    prefix = os.urandom(PREFIX_LEN)
+    header = _HEADER.pack(MAGIC, segment_size, prefix)
+    ad = header + (aad or b"")
+    bufs = [memoryview(bytearray(segment_size)) for _ in range(2)]
+    out = memoryview(bytearray(segment_size + TAG_LEN))
+    dst.write(header)
+    written, i = len(header), 0
+    n = readinto_full(src, bufs[0])
+    while True:
+        nxt = readinto_full(src, bufs[1]) if n == segment_size else 0
+        last = nxt == 0
+        _seal(aead, _nonce(prefix, i, last), bufs[0][:n], ad, out[:n + TAG_LEN])
+        dst.write(out[:n + TAG_LEN])
+        written += n + TAG_LEN
+        if last:
+            return written
+        bufs.reverse()
+        n, i = nxt, i + 1
+
+def decrypt_stream(key: bytes, src: BinaryIO, dst: BinaryIO, aad: Optional[bytes] = None,
+                   max_segment_size: int = MAX_SEGMENT_SIZE) -> int:
+    """
+    Decrypt a stream from encrypt_stream to dst; returns plaintext bytes written.
+    Raises ValidationError for a malformed header (including a segment size
+    above max_segment_size; raise the limit for streams sealed with larger
+    segments), InvalidTag on tampering, truncation, reordering or a wrong key / aad.
+    """
+    header = src.read(_HEADER.size)
+    if len(header) != _HEADER.size:
+        raise ValidationError("stream too short for its header")
+    magic, segment_size, prefix = _HEADER.unpack(header)
+    if magic != MAGIC or not 0 < segment_size < 2 ** 32 - TAG_LEN:
+        raise ValidationError("not a cryptolib AEAD stream")
+    if segment_size > max_segment_size:
+        raise ValidationError(f"segment size {segment_size} exceeds max_segment_size={max_segment_size}")
+    aead = AESGCM(key)
+    ad = header + (aad or b"")
+    size = segment_size + TAG_LEN
+    bufs = [memoryview(bytearray(size)) for _ in range(2)]
+    out = memoryview(bytearray(segment_size))
+    written, i = 0, 0
+    n = readinto_full(src, bufs[0])
+    while True:
+        nxt = readinto_full(src, bufs[1]) if n == size else 0
+        last = nxt == 0
+        _open(aead, _nonce(prefix, i, last), bufs[0][:n], ad, out[:n - TAG_LEN])
+        dst.write(out[:n - TAG_LEN])
+        written += n - TAG_LEN
+        if last:
+            return written
+        bufs.reverse()
+        n, i = nxt, i + 1
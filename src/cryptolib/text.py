@@ -0,0 +1,53 @@
+"""
+Shared A-Z text normalization for the classical ciphers and attacks.
+
+"Clean" text is uppercase A-Z only; the Playfair variant also merges J into I.
+Both are a single bytes.translate pass with precompiled tables.
+"""
+from functools import lru_cache
+from typing import Union
+
+ALPH = b"ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+TextLike = Union[str, bytes, bytearray, memoryview]
+
+# translate tables (applied after deletion): a-z -> A-Z, and the J -> I variant
+_UPPER = bytes.maketrans(ALPH.lower(), ALPH)
+_UPPER_J_TO_I = bytes.maketrans(ALPH.lower() + b"J", ALPH.replace(b"J", b"I") + b"I")
+_AZ_J_TO_I = bytes.maketrans(b"J", b"I")
+# delete tables: everything except ASCII letters / everything except A-Z
+_NON_ALPHA = bytes(b for b in range(256) if not (65 <= b <= 90 or 97 <= b <= 122))
+_NON_AZ = bytes(b for b in range(256) if not 65 <= b <= 90)
+
+def _clean(text: TextLike, upper: bytes, az: bytes) -> bytes:
+    if not isinstance(text, str):
+        # bytes fast path: ASCII letters kept, everything else (incl. >= 0x80) dropped
+        return bytes(text).translate(upper, _NON_ALPHA)
+    if text.isascii():
+        return text.encode("ascii").translate(upper, _NON_ALPHA)
+    # str.upper() may turn non-ASCII letters into A-Z (e.g. 'ß' -> 'SS')
+    return text.upper().encode("ascii", "ignore").translate(az, _NON_AZ)
+
+def clean_bytes(text: TextLike) -> bytes:
+    """Uppercase and keep only A-Z, as ASCII bytes."""
+    return _clean(text, _UPPER, None)
+
+def clean_i_bytes(text: TextLike) -> bytes:
+    """Like clean_bytes, with J merged into I (Playfair alphabet)."""
+    return _clean(text, _UPPER_J_TO_I, _AZ_J_TO_I)
+
+@lru_cache(maxsize=1024)
+def _clean_cached(text: str, merge_j: bool) -> str:
+    return (clean_i_bytes if merge_j else clean_bytes)(text).decode("ascii")
+
+def clean(text: TextLike, *, cache: bool = False) -> str:
+    """A-Z only, uppercase. cache=True memoizes results for repeated str inputs."""
+    if cache and isinstance(text, str):
+        return _clean_cached(text, False)
+    return clean_bytes(text).decode("ascii")
+
+def clean_i(text: TextLike, *, cache: bool = False) -> str:
+    """A-Z only, uppercase, J -> I."""
+    if cache and isinstance(text, str):
+        return _clean_cached(text, True)
+    return clean_i_bytes(text).decode("ascii")
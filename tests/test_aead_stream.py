@@ -0,0 +1,104 @@
+import io
+import os
+
+import pytest
+from cryptography.exceptions import InvalidTag
+from cryptolib.exceptions import ValidationError
+from cryptolib.modern.aead import stream
+from cryptolib.modern.aead.stream import TAG_LEN, decrypt_stream, encrypt_stream
+
+KEY = os.urandom(32)
+HEADER = stream._HEADER.size
+
+def seal(data: bytes, seg: int = 64, aad=None) -> bytes:
+    out = io.BytesIO()
+    n = encrypt_stream(KEY, io.BytesIO(data), out, aad, segment_size=seg)
+    assert n == len(out.getvalue())
+    return out.getvalue()
+
+def unseal(blob: bytes, aad=None, key=KEY, **kwargs) -> bytes:
+    out = io.BytesIO()
+    n = decrypt_stream(key, io.BytesIO(blob), out, aad, **kwargs)
+    assert n == len(out.getvalue())
+    return out.getvalue()
+
+@pytest.mark.parametrize("size", [0, 1, 63, 64, 65, 128, 1000])
+def test_round_trip(size):
+    data = os.urandom(size)
+    blob = seal(data, aad=b"backup-7")
+    segments = max(1, -(-size // 64))  # a full final segment carries the last flag itself
+    assert len(blob) == HEADER + size + segments * TAG_LEN
+    assert unseal(blob, aad=b"backup-7") == data
+
+def test_round_trip_through_files(tmp_path):
+    data = os.urandom(300_000)
+    (tmp_path / "plain").write_bytes(data)
+    with open(tmp_path / "plain", "rb") as src, open(tmp_path / "sealed", "wb") as dst:
+        encrypt_stream(KEY, src, dst, segment_size=4096)
+    with open(tmp_path / "sealed", "rb") as src, open(tmp_path / "out", "wb") as dst:
+        decrypt_stream(KEY, src, dst)
+    assert (tmp_path / "out").read_bytes() == data
+
+def test_truncation_reordering_and_tampering_detected():
+    data = os.urandom(64 * 4 + 10)
+    blob = seal(data)
+    seg = 64 + TAG_LEN
+    body = [blob[HEADER + i:HEADER + i + seg] for i in range(0, len(blob) - HEADER, seg)]
+    header = blob[:HEADER]
+    attacks = [
+        header + b"".join(body[:3]),                              # dropped tail at a boundary
+        blob[:-1],                                                # cut inside the last segment
+        header + body[1] + body[0] + b"".join(body[2:]),          # reordered
+        blob + body[-1],                                          # extended
+        header[:-1] + bytes([header[-1] ^ 1]) + blob[HEADER:],    # prefix changed
+        blob[:HEADER + 5] + bytes([blob[HEADER + 5] ^ 1]) + blob[HEADER + 6:],
+    ]
+    for bad in attacks:
+        with pytest.raises(InvalidTag):
+            unseal(bad)
+    with pytest.raises(InvalidTag):
+        unseal(blob, aad=b"other")
+    with pytest.raises(InvalidTag):
+        unseal(blob, key=os.urandom(32))
+
+def test_bad_headers_and_arguments():
+    with pytest.raises(ValidationError):
+        unseal(b"CLS1")
+    with pytest.raises(ValidationError):
+        unseal(b"XXXX" + seal(b"hi")[4:])
+    with pytest.raises(ValueError):
+        seal(b"x", seg=0)
+
+def test_oversized_segment_header_rejected_before_allocating(monkeypatch):
+    allocated = []
+    real_bytearray = bytearray
+    monkeypatch.setattr(stream, "bytearray", lambda n: allocated.append(n) or real_bytearray(n), raising=False)
+    forged = stream._HEADER.pack(stream.MAGIC, 2 ** 32 - TAG_LEN - 1, os.urandom(stream.PREFIX_LEN))
+    with pytest.raises(ValidationError):
+        unseal(forged + os.urandom(64))
+    assert allocated == []
+    blob = seal(os.urandom(3000), seg=2048)
+    with pytest.raises(ValidationError):
+        unseal(blob, max_segment_size=1024)
+    assert unseal(blob, max_segment_size=2048) == unseal(blob)
+
+def test_segment_limit(monkeypatch):
+    monkeypatch.setattr(stream, "MAX_SEGMENTS", 3)
+    seal(os.urandom(3 * 16), seg=16)
+    with pytest.raises(stream.NonceLimitError):
+        seal(os.urandom(3 * 16 + 1), seg=16)
+
+def test_without_into_api(monkeypatch):
+    real = stream.AESGCM
+
+    class Plain:  # AESGCM without encrypt_into / decrypt_into (older cryptography)
+        def __init__(self, key):
+            self._a = real(key)
+        def encrypt(self, *a):
+            return self._a.encrypt(*a)
+        def decrypt(self, *a):
+            return self._a.decrypt(*a)
+    data = os.urandom(500)
+    blob = seal(data)
+    monkeypatch.setattr(stream, "AESGCM", Plain)
+    assert unseal(blob) == data and unseal(seal(data)) == data
@@ -1,6 +1,9 @@
 from cryptolib.modern.hashing import md5_hexdigest, sha256_hexdigest
-from cryptolib.modern.aead.aes_gcm import encrypt as gcm_enc, decrypt as gcm_dec
+from cryptolib.modern.aead.aes_gcm import AEADContext, encrypt as gcm_enc, decrypt as gcm_dec
+from cryptolib.exceptions import NonceLimitError
+from cryptography.exceptions import InvalidTag
 import os
+import pytest
 
 def test_hash_vectors():
     assert md5_hexdigest(b"abc") == "900150983cd24fb0d6963f7d28e17f72"
@@ -11,3 +14,42 @@ def test_gcm_basic():
     m = b"hello"
     nonce, ct = gcm_enc(key, m, None)
     assert gcm_dec(key, nonce, ct, None) == m
+
+def test_aead_context_counter_nonces():
+    key = os.urandom(32)
+    ctx = AEADContext(key, nonce_prefix=b"\x01\x02\x03\x04")
+    n0, c0 = ctx.encrypt(b"first", b"hdr")
+    n1, c1 = ctx.encrypt(b"second")
+    assert n0 == b"\x01\x02\x03\x04" + (0).to_bytes(8, "big")
+    assert n1 == b"\x01\x02\x03\x04" + (1).to_bytes(8, "big")
+    # interoperates with the one-shot functions
+    assert gcm_dec(key, n0, c0, b"hdr") == b"first"
+    nonce, ct = gcm_enc(key, b"x")
+    assert ctx.decrypt(nonce, ct) == b"x"
+    with pytest.raises(InvalidTag):
+        ctx.decrypt(n0, c0)  # aad missing
+
+def test_aead_context_batches():
+    ctx = AEADContext(os.urandom(16))
+    msgs = [os.urandom(i) for i in range(50)]
+    sealed = ctx.encrypt_many(msgs, [str(i).encode() for i in range(50)])
+    assert len({n for n, _ in sealed}) == 50
+    assert ctx.decrypt_many(sealed, [str(i).encode() for i in range(50)]) == msgs
+    with pytest.raises(InvalidTag):
+        ctx.decrypt_many(sealed)
+    before = ctx.next_nonce()
+    with pytest.raises(ValueError):
+        ctx.encrypt_many(msgs, [b"too few"])
+    assert int.from_bytes(ctx.next_nonce()[4:], "big") == int.from_bytes(before[4:], "big") + 1  # no nonce spent
+
+def test_aead_context_limits():
+    ctx = AEADContext(os.urandom(16), max_invocations=3)
+    ctx.encrypt_many([b"a", b"b", b"c"])
+    with pytest.raises(NonceLimitError):
+        ctx.encrypt(b"d")
+    with pytest.raises(ValueError):
+        AEADContext(os.urandom(16), nonce_prefix=b"short")
+    with pytest.raises(ValueError):
+        AEADContext(os.urandom(15))
+    with pytest.raises(ValueError):
+        gcm_dec(os.urandom(16), b"nonce", b"ct")
@@ -20,4 +20,38 @@ def test_caesar_crack_recovers_key():
         
 def test_caesar_crack_raises_on_empty():
     with pytest.raises(ValidationError):
-        crack(" 123 !@# ")
\ No newline at end of file
+        crack(" 123 !@# ")
+
+def _ref_crack(c):
+    # the original 26-pass implementation
+    from cryptolib.cryptanalysis.frequency import FREQ_EN
+    def chisq(s):
+        obs = [s.count(ch) for ch in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"]
+        score = 0.0
+        for i in range(26):
+            e = len(s) * (FREQ_EN[i] / 100.0)
+            score += (obs[i] - e) ** 2 / e
+        return score
+    c = "".join(ch for ch in c.upper() if "A" <= ch <= "Z")
+    best = min(range(26), key=lambda k: chisq("".join(chr((ord(x) - 65 - k) % 26 + 65) for x in c)))
+    return best, "".join(chr((ord(x) - 65 - best) % 26 + 65) for x in c)
+
+def test_histogram_crack_matches_full_rescoring():
+    import random
+    from cryptolib.cryptanalysis.caesar_attack import scores
+    rng = random.Random(8)
+    for _ in range(50):
+        c = "".join(rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ e") for _ in range(rng.randint(1, 60)))
+        if not c.strip(" "):
+            continue
+        assert crack(c) == _ref_crack(c)
+    sc = scores(encrypt(EN_TEXT, 11))
+    assert len(sc) == 26 and min(sc) == sc[11]
+
+@pytest.mark.parametrize("numpy", [True, False])
+def test_letter_counts_backends(monkeypatch, numpy):
+    from cryptolib.cryptanalysis import frequency
+    if not numpy:
+        monkeypatch.setattr(frequency, "np", None)
+    for data in (b"", b"HELLOWORLD", b"ABCDEFGHIJKLMNOPQRSTUVWXYZ" * 7 + b"ZZZ"):
+        assert frequency.letter_counts(data) == [data.count(c) for c in frequency.ALPH]
@@ -1,5 +1,9 @@
+import pytest
 from cryptolib.classical.hill.hill2 import encrypt
-from cryptolib.cryptanalysis.hill_attack import recover_key
+from cryptolib.cryptanalysis import hill_attack
+from cryptolib.classical.hill import hilln
+from cryptolib.cryptanalysis.hill_attack import crack_2x2, recover_key, recover_key_n, row_scores
+from cryptolib.exceptions import NotInvertibleError, ValidationError
 
 def test_hill_known_plaintext_attack_recovers_key():
     K = [[3, 3], [2, 5]]  # invertible: det = 9, gcd(9,26)=1
@@ -16,3 +20,43 @@ def test_hill_known_plaintext_attack_recovers_key():
     for r in range(2):
         for c in range(2):
             assert K2[r][c] % 26 == K[r][c] % 26
+
+TALE = (
+    "It was the best of times, it was the worst of times, it was the age of wisdom, "
+    "it was the age of foolishness, it was the epoch of belief, it was the epoch of "
+    "incredulity, it was the season of light, it was the season of darkness"
+)
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_hill_ciphertext_only_crack(monkeypatch, use_numpy):
+    if not use_numpy:
+        monkeypatch.setattr(hill_attack, "np", None)
+    elif hill_attack.np is None:
+        pytest.skip("numpy not installed")
+    for K in ([[3, 3], [2, 5]], [[7, 8], [11, 11]], [[1, 17], [0, 3]]):
+        K2, pt = crack_2x2(encrypt(TALE, K))
+        assert K2 == K
+        assert pt.startswith("ITWASTHEBESTOFTIMES")
+
+def test_true_inverse_rows_rank_first():
+    # K^-1 of [[3,3],[2,5]] is [[15,17],[20,9]]
+    sc = row_scores(encrypt(TALE, [[3, 3], [2, 5]]))
+    top = sorted(range(676), key=sc.__getitem__)[:2]
+    assert sorted(top) == sorted([15 * 26 + 17, 20 * 26 + 9])
+    with pytest.raises(ValidationError):
+        crack_2x2("ABC")
+
+def test_hill_nxn_known_plaintext_recovery():
+    for K in ([[6, 24, 1], [13, 16, 10], [20, 17, 15]],
+              [[5, 17, 4, 15], [1, 9, 8, 2], [3, 2, 11, 7], [6, 1, 0, 13]]):
+        n = len(K)
+        pt = TALE.replace(" ", "").replace(",", "")[: n * (len(TALE) // (2 * n))]
+        assert recover_key_n(pt, hilln.encrypt(pt, K), n) == K
+
+def test_hill_nxn_rejects_short_or_wrong_crib():
+    K = [[6, 24, 1], [13, 16, 10], [20, 17, 15]]
+    with pytest.raises(NotInvertibleError):
+        recover_key_n("AAAAAA", hilln.encrypt("AAAAAA", K), 3)  # one direction only
+    c = hilln.encrypt(TALE, K)
+    with pytest.raises(ValidationError):
+        recover_key_n(TALE, c[3:] + c[:3], 3)
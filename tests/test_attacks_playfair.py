@@ -0,0 +1,62 @@
+import time
+
+import pytest
+from cryptolib.classical.playfair.helpers import build_square
+from cryptolib.classical.playfair.playfair import decrypt, encrypt
+from cryptolib.cryptanalysis import playfair_attack
+from cryptolib.cryptanalysis.playfair_attack import _Candidate, _cipher_digits, anneal, crack
+from cryptolib.cryptanalysis.scoring import decode, default_scorer
+from cryptolib.exceptions import ValidationError
+
+PLAIN = (
+    "It is a truth universally acknowledged that a single man in possession of a good "
+    "fortune must be in want of a wife. However little known the feelings or views of "
+    "such a man may be on his first entering a neighbourhood, this truth is so well "
+    "fixed in the minds of the surrounding families that he is considered the rightful "
+    "property of some one or other of their daughters."
+)
+KEY = "PLAYFAIR EXAMPLE"
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_kernel_matches_decrypt_under_mutations(monkeypatch, use_numpy):
+    import random
+    if not use_numpy:
+        monkeypatch.setattr(playfair_attack, "np", None)
+    elif playfair_attack.np is None:
+        pytest.skip("numpy not installed")
+    c = encrypt(PLAIN, KEY) + "Q"  # odd length: padded like playfair.decrypt
+    cand = _Candidate(_cipher_digits(c), build_square(KEY), default_scorer())
+    rng = random.Random(5)
+    for _ in range(300):
+        move, args = cand.random_move(rng)
+        move(*args)
+        assert all(cand.sq[cand.pos[d]] == d for d in cand.sq)
+        assert decode(cand.decrypt_digits()) == decrypt(c, cand.square)
+
+def test_annealing_repairs_near_correct_square():
+    sq = list(build_square(KEY))
+    sq[3], sq[17] = sq[17], sq[3]
+    c = encrypt(PLAIN, KEY)
+    score, found = anneal(c, "".join(sq), seed=1, temp=2.0, step=1.0, per_temp=1500)
+    assert score >= default_scorer().score(decrypt(c, KEY))
+    assert decrypt(c, found) == decrypt(c, KEY)
+
+def test_crack_returns_consistent_key_within_budget():
+    c = encrypt(PLAIN, KEY)
+    square, pt = crack(c, time_budget=0.3, max_workers=2, restarts=2, seed=0, per_temp=200)
+    assert sorted(square) == sorted(build_square(KEY))
+    assert pt == decrypt(c, square)
+    with pytest.raises(ValidationError):
+        crack("1 2 3", time_budget=0.1)
+
+def test_restarts_share_the_budget(monkeypatch):
+    real, seen = playfair_attack._restart_worker, []
+    def spy(*args):
+        t = time.time()
+        result = real(*args)
+        seen.append((args[3], time.time() - t))
+        return result
+    monkeypatch.setattr(playfair_attack, "_restart_worker", spy)
+    crack(encrypt(PLAIN, KEY), time_budget=0.3, max_workers=1, restarts=3, seed=0, per_temp=200)
+    assert [b for b, _ in seen] == [pytest.approx(0.1)] * 3
+    assert all(elapsed >= 0.05 for _, elapsed in seen)  # no chain starts past the deadline
@@ -27,3 +27,42 @@ def test_vigenere_crack_recovers_plaintext_and_roundtrip():
         return k
 
     assert compress(got_key) == "MAGNUM"
+
+
+def test_period_score_equals_score_of_decrypted_text():
+    from cryptolib.cryptanalysis.vigenere_attack import _key_for_period
+    from cryptolib.cryptanalysis.frequency import chisq_counts, column_counts, letter_counts
+    from cryptolib.text import clean_bytes
+    c = clean_bytes(encrypt(EN_TEXT, "MAGNUM"))
+    for m in (1, 5, 6, 12):
+        score, shifts = _key_for_period(column_counts(c, m))
+        key = "".join(chr(65 + k) for k in shifts)
+        pt = clean_bytes(decrypt(c.decode(), key))
+        assert abs(score - chisq_counts(letter_counts(pt))) < 1e-9
+    assert _key_for_period(column_counts(c, 6))[1] == [ord(ch) - 65 for ch in "MAGNUM"]
+
+def test_ioc_estimator_and_long_key():
+    from cryptolib.cryptanalysis.vigenere_attack import estimate_periods
+    key = "THEQUICKBROWNFOXJUMPSOVERLAZYDO"  # period 31
+    c = encrypt(EN_TEXT * 5, key)
+    assert estimate_periods(c)[0][0] == 31
+    assert estimate_periods(encrypt(EN_TEXT, "MAGNUM"), max_period=20)[0][0] == 6
+    got_key, pt = crack(c)
+    assert got_key == key and pt == clean(EN_TEXT * 5)
+
+
+def test_ioc_scan_shares_column_counts(monkeypatch):
+    from cryptolib.cryptanalysis import vigenere_attack as va
+    from cryptolib.cryptanalysis.frequency import column_counts
+    from cryptolib.text import clean_bytes
+    c = clean_bytes(encrypt(EN_TEXT * 4, "ABCDEFGHIJKLMNOPQRSTUVWXYZABCDEFGHIJKLM"))
+    passes = []
+    real = va._residue_counts
+    monkeypatch.setattr(va, "_residue_counts", lambda s, L: passes.append(L) or real(s, L))
+    for backend in (va.np, None):
+        monkeypatch.setattr(va, "np", backend)
+        passes.clear()
+        scores, cols, stopped = va._ioc_scan(c, 40, 1.0, 1.0)
+        assert not stopped and sorted(scores) == list(range(1, 41))
+        assert all(cols[m] == column_counts(c, m) for m in scores)
+        assert len(passes) < 10 and all(L <= va.MAX_MODULUS for L in passes)
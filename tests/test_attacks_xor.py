@@ -0,0 +1,41 @@
+import os
+
+import pytest
+from cryptolib.cryptanalysis import xor_attack
+from cryptolib.cryptanalysis._english_sample import TEXT
+from cryptolib.cryptanalysis.xor_attack import (
+    candidates, crack, estimate_keysizes, hamming, key_for_size, repeating_xor,
+)
+from cryptolib.exceptions import ValidationError
+
+PLAIN = TEXT.encode()[:6000]
+
+def test_hamming():
+    assert hamming(b"this is a test", b"wokka wokka!!!") == 37
+    with pytest.raises(ValidationError):
+        hamming(b"a", b"")
+
+@pytest.mark.parametrize("keylen", [1, 5, 29, 97])
+def test_keysize_estimate_and_crack(keylen):
+    key = os.urandom(keylen)
+    ct = repeating_xor(PLAIN * (1 + keylen // 20), key)
+    assert estimate_keysizes(ct, max_keysize=128)[0][0] == keylen
+    assert crack(ct, max_keysize=128) == (key, PLAIN * (1 + keylen // 20))
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_key_for_size_matches_fallback(monkeypatch, use_numpy):
+    if not use_numpy:
+        monkeypatch.setattr(xor_attack, "np", None)
+    elif xor_attack.np is None:
+        pytest.skip("numpy not installed")
+    ct = repeating_xor(PLAIN, b"ICE!")
+    score, key = key_for_size(ct, 8)
+    assert key == b"ICE!ICE!" and -1.6 < score < -1.0
+    best, _ = candidates(ct)[0]
+    assert best == b"ICE!"
+
+def test_rejects_tiny_input():
+    with pytest.raises(ValidationError):
+        crack(b"x")
+    with pytest.raises(ValidationError):
+        repeating_xor(b"abc", b"")
@@ -0,0 +1,61 @@
+import threading
+import time
+import pytest
+from cryptolib.classical.caesar import encrypt
+from cryptolib.classical.vigenere import encrypt as v_encrypt
+from cryptolib.cryptanalysis.batch import BatchResult, crack_many
+
+MSG = "THE QUICK BROWN FOX JUMPS OVER THE LAZY DOG AND KEEPS RUNNING ALONG THE RIVER BANK"
+
+def _slow_attack(c: str):
+    if c.startswith("SLOW"):
+        time.sleep(5)
+    return 0, c
+
+def test_ordered_results_match_input_order():
+    cts = [encrypt(MSG, k) for k in range(26)] * 3
+    results = list(crack_many(cts, "caesar", max_workers=2, chunk_chars=200))
+    assert [r.index for r in results] == list(range(len(cts)))
+    assert all(r.ok and r.key == i % 26 for i, r in enumerate(results))
+
+def test_unordered_and_vigenere():
+    text = (
+        "Alice was beginning to get very tired of sitting by her sister on the bank, "
+        "and of having nothing to do: once or twice she had peeped into the book her "
+        "sister was reading, but it had no pictures or conversations in it."
+    ) * 3
+    cts = [v_encrypt(text, "LEMON")] * 8
+    results = list(crack_many(iter(cts), "vigenere", max_workers=2, ordered=False, max_items=3))
+    assert sorted(r.index for r in results) == list(range(8))
+    assert {r.key for r in results} == {"LEMON"}
+
+def test_errors_are_reported_per_item():
+    results = list(crack_many(["123", encrypt(MSG, 3)], "caesar", max_workers=1))
+    assert not results[0].ok and "ValidationError" in results[0].error
+    assert results[1] == BatchResult(1, 3, encrypt(MSG, 0))
+
+def test_per_item_timeout():
+    if not hasattr(__import__("signal"), "setitimer"):
+        pytest.skip("per-item timeouts need signal.setitimer")
+    results = list(crack_many(["FAST", "SLOW", "FAST"], _slow_attack, max_workers=1, item_timeout=0.2))
+    assert [r.error for r in results] == [None, "timeout", None]
+
+def test_cancel_stops_early():
+    cancel = threading.Event()
+    out = []
+    for r in crack_many((encrypt(MSG, 1) for _ in range(10_000)), max_workers=1, max_items=10, cancel=cancel):
+        out.append(r)
+        if len(out) == 5:
+            cancel.set()
+    assert 5 <= len(out) < 10_000
+
+def test_unknown_attack_name():
+    with pytest.raises(ValueError):
+        list(crack_many(["ABC"], "enigma"))
+
+def test_timeout_rejected_without_setitimer(monkeypatch):
+    from cryptolib.cryptanalysis import batch
+    monkeypatch.delattr(batch.signal, "setitimer", raising=False)
+    with pytest.raises(ValueError):
+        list(crack_many(["ABC"], "caesar", item_timeout=1.0))
+    assert [r.ok for r in crack_many(["ABC"], "caesar", max_workers=1)] == [True]
@@ -11,3 +11,15 @@ def test_round_trip_basic():
 def test_known_vector():
     assert encrypt("HELLO", 3) == "KHOOR"
     assert decrypt("KHOOR", 3) == "HELLO"
+
+
+def _ref_encrypt(text: str, k: int) -> str:
+    # the original per-character implementation
+    s = "".join(ch for ch in text.upper() if "A" <= ch <= "Z")
+    return "".join(chr(((ord(c) - 65 + (k % 26)) % 26) + 65) for c in s)
+
+def test_matches_per_char_reference_on_noisy_text():
+    msg = "Straße, ﬁne déjà-vu! 123 ıi " + "".join(chr(i) for i in range(300))
+    for k in (0, 5, 25, -7, 100):
+        assert encrypt(msg, k) == _ref_encrypt(msg, k)
+        assert decrypt(msg, k) == _ref_encrypt(msg, -k)
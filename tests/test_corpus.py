@@ -0,0 +1,61 @@
+import io
+import pickle
+
+import pytest
+from cryptolib.cryptanalysis import corpus, scoring
+from cryptolib.cryptanalysis.corpus import NgramCounter, count_file, count_text
+from cryptolib.cryptanalysis.scoring import QuadgramScorer, load_model, save_model, train_model
+
+TEXT = (
+    "Whether I shall turn out to be the hero of my own life, or whether that station "
+    "will be held by anybody else, these pages must show. To begin my life with the "
+    "beginning of my life, I record that I was born (as I have been informed and believe) "
+    "on a Friday, at twelve o'clock at night. "
+) * 3
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_chunked_counts_match_one_shot(monkeypatch, use_numpy):
+    if not use_numpy:
+        monkeypatch.setattr(corpus, "np", None)
+    elif corpus.np is None:
+        pytest.skip("numpy not installed")
+    whole = count_text(TEXT)
+    for size in (1, 5, 64):
+        assert count_file(io.BytesIO(TEXT.encode()), chunk_size=size).counts() == whole
+
+def test_counts_are_base26_indexed():
+    c1, c2, c3, c4 = count_text("abcab")
+    assert c1[0] == 2 and c1[2] == 1 and sum(c1) == 5
+    assert c2[0 * 26 + 1] == 2 and sum(c2) == 4
+    assert c3[0 * 676 + 1 * 26 + 2] == 1 and sum(c3) == 3
+    assert sum(c4) == 2
+    counter = NgramCounter()
+    counter.update("ab")
+    counter.update("-cab!")
+    assert counter.counts() == [c1, c2, c3, c4] and counter.letters == 5
+
+def test_model_file_round_trip(tmp_path):
+    src = tmp_path / "corpus.txt"
+    src.write_text(TEXT)
+    model = tmp_path / "en.cqg"
+    train_model([src], model, chunk_size=16)
+    loaded = load_model(model)
+    trained = QuadgramScorer.from_text(TEXT)
+    assert loaded.score(TEXT) == pytest.approx(trained.score(TEXT))
+    assert loaded.score("ZQXJ") == pytest.approx(trained.score("ZQXJ"))
+    # pickles as its path: pool workers re-map the file
+    clone = pickle.loads(pickle.dumps(loaded))
+    assert clone.path == str(model) and clone.score(TEXT) == pytest.approx(loaded.score(TEXT))
+
+def test_load_model_without_numpy(tmp_path, monkeypatch):
+    model = tmp_path / "en.cqg"
+    save_model(model, count_text(TEXT))
+    expected = load_model(model).score(TEXT)
+    monkeypatch.setattr(scoring, "np", None)
+    assert load_model(model).score(TEXT) == pytest.approx(expected)
+
+def test_load_model_rejects_other_files(tmp_path):
+    bad = tmp_path / "bad.cqg"
+    bad.write_bytes(b"not a model" * 100)
+    with pytest.raises(ValueError):
+        load_model(bad)
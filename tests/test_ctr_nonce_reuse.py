@@ -0,0 +1,40 @@
+import os
+import random
+
+import pytest
+from cryptolib.cryptanalysis import ctr_nonce_reuse
+from cryptolib.cryptanalysis._english_sample import TEXT
+from cryptolib.cryptanalysis.ctr_nonce_reuse import ColumnStats, aes_ctr_encrypt, estimate_keystream
+
+WORDS = TEXT.split()
+KEY, NONCE = os.urandom(16), os.urandom(16)
+KEYSTREAM = aes_ctr_encrypt(KEY, NONCE, bytes(200))
+
+def records(n: int, seed: int = 1):
+    rng = random.Random(seed)
+    for _ in range(n):
+        i = rng.randrange(len(WORDS) - 20)
+        yield aes_ctr_encrypt(KEY, NONCE, " ".join(WORDS[i:i + rng.randrange(6, 12)]).encode())
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_keystream_from_many_ciphertexts(monkeypatch, use_numpy):
+    if not use_numpy:
+        monkeypatch.setattr(ctr_nonce_reuse, "np", None)
+    elif ctr_nonce_reuse.np is None:
+        pytest.skip("numpy not installed")
+    est = estimate_keystream(records(1500), batch=256)
+    deep = [q for q, d in enumerate(est.depth) if d >= 200]
+    assert len(deep) >= 30
+    assert all(est.keystream[q] == KEYSTREAM[q] for q in deep)
+    assert all(est.confidence[q] > 0.99 for q in deep)
+    assert all(0.0 < c <= 1.0 for c in est.confidence)
+
+def test_batches_and_max_len_do_not_change_counts():
+    cts = list(records(300, seed=4))
+    one = ColumnStats()
+    one.update(cts)
+    est = estimate_keystream(iter(cts), batch=7)
+    assert est == one.estimate()
+    short = estimate_keystream(cts, max_len=10)
+    assert len(short.keystream) == 10 and short.keystream == est.keystream[:10]
+    assert est.decrypt(cts[0])[:10] == bytes(a ^ b for a, b in zip(cts[0], KEYSTREAM[:10]))
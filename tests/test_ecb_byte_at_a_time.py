@@ -0,0 +1,59 @@
+import hashlib
+import os
+
+import pytest
+from cryptography.hazmat.primitives import padding
+from cryptolib.cryptanalysis.ecb_byte_at_a_time import (
+    CountingOracle, detect_block_size, detect_prefix_length, recover_suffix,
+)
+from cryptolib.exceptions import ValidationError
+from cryptolib.experiments.cpa import _ecb_encrypt
+
+SECRET = b"Rollin' in my 5.0\nWith my rag-top down so my hair can blow\x01\x00\xff"
+
+def aes_oracle(prefix: bytes, secret: bytes = SECRET):
+    key = os.urandom(16)
+    def oracle(data: bytes) -> bytes:
+        p = padding.PKCS7(128).padder()
+        return _ecb_encrypt(key, p.update(prefix + data + secret) + p.finalize())
+    return oracle
+
+def toy_oracle(block: int, prefix: bytes, secret: bytes = SECRET):
+    """ECB over a keyed hash 'cipher' with any block size, zero-padded."""
+    key = os.urandom(16)
+    def oracle(data: bytes) -> bytes:
+        m = prefix + data + secret
+        m += b"\x00" * (-len(m) % block)
+        return b"".join(hashlib.sha256(key + m[i:i + block]).digest()[:block]
+                        for i in range(0, len(m), block))
+    return oracle
+
+@pytest.mark.parametrize("plen", [0, 1, 5, 15, 16, 37])
+def test_recovers_suffix_behind_random_prefix(plen):
+    oracle = CountingOracle(aes_oracle(os.urandom(plen)))
+    r = recover_suffix(oracle)
+    assert r.secret == SECRET and r.block == 16 and r.prefix_len == plen
+    # one call per byte, plus detection and the pad byte / miss at the end
+    assert r.queries == oracle.calls == len(SECRET) + 4
+
+def test_prefix_ending_in_probe_filler():
+    for tail in (b"\x00" * 20, b"\xff" * 3, b"A" * 9):
+        oracle = aes_oracle(os.urandom(7) + tail)
+        assert detect_prefix_length(oracle, 16) == 7 + len(tail)
+
+@pytest.mark.parametrize("block", [8, 32])
+def test_other_block_sizes(block):
+    oracle = toy_oracle(block, os.urandom(11))
+    assert detect_block_size(oracle) == block
+    r = recover_suffix(oracle, max_len=len(SECRET))
+    assert r.secret == SECRET and r.prefix_len == 11
+
+def test_zero_padding_stops_at_ciphertext_length():
+    r = recover_suffix(toy_oracle(16, b""))
+    assert r.secret.rstrip(b"\x00") == SECRET.rstrip(b"\x00") and len(r.secret) < len(SECRET) + 16
+
+def test_rejects_non_ecb_oracle():
+    with pytest.raises(ValidationError):
+        detect_block_size(lambda data: os.urandom(len(data) + 16))
+    with pytest.raises(ValidationError):
+        recover_suffix(lambda data: os.urandom(len(data) + 16))
@@ -0,0 +1,65 @@
+import random
+
+import pytest
+from cryptolib.cryptanalysis import ecb_pattern
+from cryptolib.cryptanalysis.ecb_pattern import has_repeated_blocks, rank, scan, scan_file
+
+rng = random.Random(7)
+BLOCKS = [bytes(rng.randrange(256) for _ in range(16)) for _ in range(8)]
+
+def ecb_like(n_blocks: int, prefix: int = 0) -> bytes:
+    noise = bytes(rng.randrange(256) for _ in range(prefix))
+    return noise + b"".join(rng.choice(BLOCKS) for _ in range(n_blocks))
+
+def noise(n: int) -> bytes:
+    return bytes(rng.randrange(256) for _ in range(n))
+
+def test_has_repeated_blocks_semantics():
+    assert has_repeated_blocks(b"A" * 32)
+    assert not has_repeated_blocks(b"A" * 16 + b"A" * 15)  # trailing partial block never repeats
+    assert not has_repeated_blocks(b"")
+    assert has_repeated_blocks(bytearray(b"xy" * 8 * 3), 16)
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_scan_finds_misaligned_ecb(monkeypatch, use_numpy):
+    if not use_numpy:
+        monkeypatch.setattr(ecb_pattern, "np", None)
+    elif ecb_pattern.np is None:
+        pytest.skip("numpy not installed")
+    data = ecb_like(200, prefix=5) + noise(7)
+    r = scan(data, chunk_size=256)
+    assert r.offset == 5 and r.blocks == 200
+    assert r.repeats == 200 - len(set(data[5 + 16 * k:21 + 16 * k] for k in range(200)))
+    assert r.is_ecb and r.repeat_ratio > 0.9
+    for pos, first in r.positions:
+        assert first < pos and data[pos:pos + 16] == data[first:first + 16]
+    assert not scan(noise(4096)).is_ecb
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_tracking_window_bounds_memory(monkeypatch, use_numpy):
+    if not use_numpy:
+        monkeypatch.setattr(ecb_pattern, "np", None)
+    elif ecb_pattern.np is None:
+        pytest.skip("numpy not installed")
+    block = noise(16)
+    data = block + noise(16 * 4000) + block
+    assert scan(data, offsets=(0,)).repeats == 1
+    assert scan(data, offsets=(0,), chunk_size=1024, max_tracked=256).repeats == 0
+
+def test_scan_file_memory_maps(tmp_path):
+    path = tmp_path / "disk.img"
+    path.write_bytes(noise(1000) + ecb_like(64) + noise(1000))
+    r = scan_file(path)
+    assert r.offset == 1000 % 16 and r.is_ecb
+    empty = tmp_path / "empty.img"
+    empty.write_bytes(b"")
+    assert scan_file(empty).blocks == 0
+
+def test_rank_puts_ecb_first():
+    cts = [noise(512) for _ in range(20)]
+    cts[13] = ecb_like(32)
+    cts[4] = noise(3) + ecb_like(32)
+    ranked = rank(cts, top=3)
+    assert ranked[0][0] == 13 and ranked[0][1].is_ecb
+    assert {i for i, _ in rank(cts, all_offsets=True)[:2]} == {4, 13}
+    assert len(rank(cts)) == 20
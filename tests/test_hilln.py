@@ -0,0 +1,50 @@
+import pytest
+from cryptolib.classical.hill import hilln
+from cryptolib.classical.hill.hilln import HillKey, compile_key, encrypt, decrypt
+from cryptolib.classical.hill.helpers import det, adjugate, inv_mod26, inv2x2_mod26
+from cryptolib.exceptions import InvalidKeyError
+
+K3 = [[6, 24, 1], [13, 16, 10], [20, 17, 15]]  # classic "GYBNQKURP" key
+
+def _matmul(A, B):
+    return [[sum(a * b for a, b in zip(row, col)) % 26 for col in zip(*B)] for row in A]
+
+def test_known_vector_3x3():
+    assert encrypt("ACT", K3) == "POH"
+    assert decrypt("POH", K3) == "ACT"
+
+def test_det_adjugate_and_inverse():
+    assert det(K3) == 441
+    n = len(K3)
+    ident = [[int(i == j) for j in range(n)] for i in range(n)]
+    adj = adjugate(K3)
+    assert [[x % 26 for x in r] for r in _matmul(K3, adj)] == [[(441 * x) % 26 for x in r] for r in ident]
+    assert _matmul(K3, inv_mod26(K3)) == ident
+    K2 = [[3, 3], [2, 5]]
+    assert inv_mod26(K2) == inv2x2_mod26(K2)
+
+def test_round_trip_and_padding_larger_key():
+    K = [[1, 2, 3, 4], [0, 1, 5, 7], [0, 0, 1, 9], [2, 0, 0, 1]]
+    key = compile_key(K)
+    msg = "The quick brown fox jumps over the lazy dog"
+    c = key.encrypt(msg)
+    assert len(c) % 4 == 0
+    assert key.decrypt(c) == "THEQUICKBROWNFOXJUMPSOVERTHELAZYDOG" + "X"
+
+def test_compiled_key_is_cached():
+    assert compile_key(K3) is compile_key([row[:] for row in K3])
+    key = compile_key(K3)
+    assert compile_key(key) is key and isinstance(key, HillKey)
+
+def test_invalid_keys_raise():
+    with pytest.raises(InvalidKeyError):
+        compile_key([[2, 4], [2, 6]])
+    with pytest.raises(InvalidKeyError):
+        compile_key([[1, 2, 3], [4, 5, 6]])
+
+def test_pure_python_path_matches(monkeypatch):
+    msg = "Meet me at the usual place at ten rather than eight o'clock" * 5
+    expected = encrypt(msg, K3)
+    monkeypatch.setattr(hilln, "np", None)
+    assert encrypt(msg, K3) == expected
+    assert decrypt(expected, K3).startswith("MEETMEATTHEUSUALPLACE")
@@ -1,5 +1,6 @@
 import pytest
-from cryptolib.mathutils.number import egcd, modinv, modexp
+from cryptolib.mathutils.number import crt, egcd, modinv, modexp
+from cryptolib.mathutils.linalg import RowBasis, prime_factors, solve_mod
 from cryptolib.exceptions import NotInvertibleError
 
 def test_egcd_invariant():
@@ -19,4 +20,30 @@ def test_modexp_basics():
     assert modexp(3, 15, 1) == 0         # b^exp = 0 (mod 1)
     # consistency with Python's pow(a, e, m) for a few values
     for (a, e, m) in [(5, 117, 19), (42, 73, 101), (-7, 9, 26)]:
-        assert modexp(a, e, m) == pow(a, e, m)
\ No newline at end of file
+        assert modexp(a, e, m) == pow(a, e, m)
+
+def test_crt_and_factors():
+    assert crt([1, 5], [2, 13]) == 5
+    assert all(crt([x % 2, x % 13], [2, 13]) == x for x in range(26))
+    assert prime_factors(26) == [2, 13] and prime_factors(30) == [2, 3, 5]
+    with pytest.raises(ValueError):
+        prime_factors(12)
+    with pytest.raises(NotInvertibleError):
+        crt([1, 1], [4, 6])
+
+def test_solve_mod_composite_modulus():
+    A = [[2, 13, 1], [1, 1, 0], [0, 3, 8]]  # det = -85: a unit mod 2 and mod 13
+    B = [[1, 2], [3, 4], [5, 6]]
+    X = solve_mod(A, B, 26)
+    for i in range(3):
+        for j in range(2):
+            assert sum(A[i][k] * X[k][j] for k in range(3)) % 26 == B[i][j]
+    with pytest.raises(NotInvertibleError):
+        solve_mod([[2, 4], [1, 2]], [[1], [1]], 26)
+
+def test_row_basis_skips_dependent_rows():
+    basis = RowBasis(3, 13)
+    assert basis.add([1, 2, 3], [1])
+    assert not basis.add([2, 4, 6], [2])
+    assert basis.add([0, 1, 1], [0]) and not basis.full
+    assert basis.add([1, 0, 0], [5]) and basis.full
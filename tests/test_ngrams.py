@@ -0,0 +1,37 @@
+import pytest
+from cryptolib.classical.vigenere import encrypt
+from cryptolib.cryptanalysis import ngrams
+from cryptolib.cryptanalysis.ngrams import NgramIndex
+from cryptolib.cryptanalysis.vigenere_attack import kasiski_lengths
+
+TEXT = (
+    "It was the best of times, it was the worst of times, it was the age of wisdom, "
+    "it was the age of foolishness, it was the epoch of belief, it was the epoch of "
+    "incredulity, it was the season of Light, it was the season of Darkness, it was "
+    "the spring of hope, it was the winter of despair, we had everything before us, "
+) * 4
+
+def test_codes_are_base26_ngrams():
+    idx = NgramIndex("ab-cd", min_len=2, max_len=3)
+    assert list(idx.codes(2)) == [0 * 26 + 1, 1 * 26 + 2, 2 * 26 + 3]
+    assert list(idx.codes(3)) == [0 * 676 + 1 * 26 + 2, 1 * 676 + 2 * 26 + 3]
+
+def test_repeat_distances_match_substring_scan():
+    s = "ABCXXABCYYABC"
+    idx = NgramIndex(s, 3, 3)
+    assert sorted(idx.repeat_distances(3)) == [5, 5]
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_kasiski_ranks_true_period_first(monkeypatch, use_numpy):
+    if not use_numpy:
+        monkeypatch.setattr(ngrams, "np", None)
+    elif ngrams.np is None:
+        pytest.skip("numpy not installed")
+    c = encrypt(TEXT, "DICKENS")
+    assert kasiski_lengths(c)[0] == 7
+    hist = NgramIndex(c, max_len=6).factor_histogram(30)
+    assert hist[0][0] == 7 and all(f <= 30 for f, _ in hist)
+
+def test_no_repeats_gives_empty_histogram():
+    assert NgramIndex("ABCDEFG").factor_histogram() == []
+    assert kasiski_lengths("") == []
@@ -62,3 +62,38 @@ def test_aes_gcm_round_trip_and_tamper_detection():
     bad[0] ^= 0x01
     with pytest.raises(InvalidTag):
         gcm_dec(key, nonce, bytes(bad), aad)
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_xor_kernels_accept_buffers_and_write_in_place(monkeypatch, use_numpy):
+    import mmap
+    from cryptolib.classical import otp
+    if not use_numpy:
+        monkeypatch.setattr(otp, "np", None)
+    elif otp.np is None:
+        pytest.skip("numpy not installed")
+    a, b = os.urandom(1000), os.urandom(1000)
+    expected = bytes(x ^ y for x, y in zip(a, b))
+    assert otp.xor_bytes(bytearray(a), memoryview(b)) == expected
+    with mmap.mmap(-1, len(a)) as mm:
+        mm.write(a)
+        assert otp.xor_bytes(mm, b) == expected
+        otp.xor_into(mm, mm, b)          # in place, into the mmap
+        assert mm[:] == expected
+    dst = bytearray(len(a))
+    otp.xor_into(dst, a, b)
+    assert dst == expected
+    with pytest.raises(ValidationError):
+        otp.xor_into(bytes(len(a)), a, b)
+
+def test_otp_stream_matches_one_shot_and_checks_key_length():
+    import io
+    from cryptolib.classical.otp import encrypt_stream, xor_stream
+    m = os.urandom(10_000)
+    k = os.urandom(len(m))
+    out = io.BytesIO()
+    assert encrypt_stream(io.BytesIO(m), io.BytesIO(k), out, chunk_size=777) == len(m)
+    assert out.getvalue() == otp_enc(m, k)
+    with pytest.raises(ValidationError):
+        xor_stream(io.BytesIO(m), io.BytesIO(k[:-1]), io.BytesIO())
+    with pytest.raises(ValidationError):
+        encrypt_stream(io.BytesIO(m), io.BytesIO(k + b"!"), io.BytesIO())
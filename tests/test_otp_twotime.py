@@ -0,0 +1,86 @@
+import os
+import random
+
+import pytest
+from cryptolib.cryptanalysis import frequency, otp_twotime
+from cryptolib.cryptanalysis.frequency import BYTE_LOGP_EN, xor_key_scores
+from cryptolib.cryptanalysis.otp_twotime import drag_crib, recover_keystream, recover_with_crib
+from cryptolib.exceptions import ValidationError
+
+SENTENCES = [
+    b"Four score and seven years ago our fathers brought forth on this continent",
+    b"We hold these truths to be self-evident, that all men are created equal",
+    b"It was the best of times, it was the worst of times, it was the age of wisdom",
+    b"Call me Ishmael. Some years ago, never mind how long precisely",
+    b"It is a truth universally acknowledged, that a single man in possession of a good fortune",
+    b"Alice was beginning to get very tired of sitting by her sister on the bank",
+    b"To Sherlock Holmes she is always the woman. I have seldom heard him mention her",
+    b"The world is too much with us; late and soon, getting and spending",
+]
+
+def corpus(n: int, seed: int = 3):
+    rng = random.Random(seed)
+    msgs = [rng.choice(SENTENCES)[rng.randrange(0, 8):] for _ in range(n)]
+    ks = os.urandom(100)
+    return msgs, ks, [bytes(a ^ b for a, b in zip(m, ks)) for m in msgs]
+
+def test_xor_key_scores_rank_true_key():
+    text = b" ".join(SENTENCES)
+    hist = [0] * 256
+    for b in text:
+        hist[b ^ 0x5A] += 1
+    sc = xor_key_scores(hist)
+    assert sc.index(max(sc)) == 0x5A
+    assert sc[0x5A] == pytest.approx(sum(BYTE_LOGP_EN[b] for b in text))
+
+def test_xor_key_scores_without_numpy(monkeypatch):
+    hist = [3 if 97 <= b < 123 else 0 for b in range(256)]
+    expected = xor_key_scores(hist)
+    monkeypatch.setattr(frequency, "np", None)
+    assert xor_key_scores(hist) == pytest.approx(expected)
+
+def test_recover_with_crib_uses_window_only():
+    assert recover_with_crib(b"\x01\x02\x03", b"\x01\x00", b"\x05", 1) == b"\x07"
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_drag_crib_finds_placements(monkeypatch, use_numpy):
+    if not use_numpy:
+        monkeypatch.setattr(otp_twotime, "np", None)
+    elif otp_twotime.np is None:
+        pytest.skip("numpy not installed")
+    msgs, ks, cts = corpus(40)
+    hits = drag_crib(cts, b" the ", top=5)
+    assert hits and hits[0].score > -2.0
+    for h in hits[:3]:
+        assert msgs[h.message][h.position:h.position + 5] == b" the "
+        assert h.keystream == ks[h.position:h.position + 5]
+    # identical implied windows are reported once
+    assert len({(h.position, h.keystream) for h in hits}) == len(hits)
+    assert drag_crib(cts, b"\x00\x01\x02", top=None, min_score=-2.0) == []
+
+def test_drag_crib_agrees_without_numpy(monkeypatch):
+    if otp_twotime.np is None:
+        pytest.skip("numpy not installed")
+    _, _, cts = corpus(25, seed=5)
+    fast = drag_crib(cts, b" and ", top=None)
+    monkeypatch.setattr(otp_twotime, "np", None)
+    slow = drag_crib(cts, b" and ", top=None)
+    assert [(h.position, h.keystream) for h in fast][:10] == [(h.position, h.keystream) for h in slow][:10]
+    assert [h.score for h in fast] == pytest.approx([h.score for h in slow])
+
+def test_recover_keystream_is_mostly_right():
+    msgs, ks, cts = corpus(200)
+    pk = recover_keystream(cts, [b" the ", b" and ", b" of ", b"was "])
+    known = [q for q in range(len(pk.known)) if pk.known[q]]
+    assert len(known) > 30
+    assert sum(pk.keystream[q] == ks[q] for q in known) >= 0.9 * len(known)
+    out = pk.decrypt(cts[0])
+    assert len(out) == len(cts[0]) and sum(a == b for a, b in zip(out, msgs[0])) > 25
+
+def test_empty_crib_rejected():
+    with pytest.raises(ValidationError):
+        drag_crib([b"abc"], b"")
+
+def test_crib_longer_than_ciphertexts():
+    assert drag_crib([b"ab", b"c"], b"abcd") == []
+    assert drag_crib([b"ab", b"cd"], b"abc") == []
@@ -39,3 +39,35 @@ def test_encrypt_decrypt_symmetry_many():
 def test_empty_key_raises():
     with pytest.raises(ValidationError):
         encrypt("HELLO", "")
+
+def _ref_encrypt(msg, key):
+    # the original branch-per-digraph implementation
+    from cryptolib.classical.playfair.helpers import at, loc_map
+    sq = build_square(key)
+    loc = loc_map(sq)
+    out = []
+    for a, b in prepare_pairs(msg):
+        (ra, ca), (rb, cb) = loc[a], loc[b]
+        if ra == rb:
+            out += [at(sq, ra, ca + 1), at(sq, rb, cb + 1)]
+        elif ca == cb:
+            out += [at(sq, ra + 1, ca), at(sq, rb + 1, cb)]
+        else:
+            out += [at(sq, ra, cb), at(sq, rb, ca)]
+    return "".join(out)
+
+def test_lookup_tables_match_rules_and_invert():
+    from cryptolib.classical.playfair.playfair import compile_key
+    key = compile_key("MONARCHY")
+    assert len(key.enc) == len(key.dec) == 625
+    for dg, e in key.enc.items():
+        if dg[0] != dg[1]:
+            assert key.dec[e] == dg
+    msg = "Hide the gold in the tree stump, quickly! XX jazz"
+    assert encrypt(msg, "MONARCHY") == _ref_encrypt(msg, "MONARCHY")
+    assert encrypt("X", "KEYWORD") == _ref_encrypt("X", "KEYWORD")
+
+def test_compiled_keys_are_cached():
+    from cryptolib.classical.playfair.playfair import compile_key
+    assert compile_key("PLAYFAIR") is compile_key("PLAYFAIR")
+    assert compile_key.cache_info().maxsize is not None
@@ -0,0 +1,61 @@
+from array import array
+
+import pytest
+from cryptolib.classical.caesar import encrypt as caesar_encrypt
+from cryptolib.classical.vigenere import encrypt as vigenere_encrypt
+from cryptolib.cryptanalysis import caesar_attack, corpus, scoring, vigenere_attack
+from cryptolib.cryptanalysis.scoring import N_QUAD, QuadgramScorer, default_scorer, encode
+
+PLAIN = (
+    "Nobody could have guessed how quickly the little village would change once the "
+    "railway arrived, bringing merchants, travellers and news from every distant city "
+    "along the coast, and with them a restless hunger for something new."
+)
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_rescore_matches_full_score(monkeypatch, use_numpy):
+    if not use_numpy:
+        monkeypatch.setattr(scoring, "np", None)
+        monkeypatch.setattr(corpus, "np", None)
+    elif scoring.np is None:
+        pytest.skip("numpy not installed")
+    sc = QuadgramScorer.from_text(PLAIN * 2)
+    d = encode(PLAIN)
+    total = sc.score_digits(d)
+    for positions, values in [([0, 1], [5, 6]), ([len(d) - 1], [25]),
+                              (range(3, len(d), 7), [0] * len(range(3, len(d), 7))),
+                              (range(len(d)), bytes(len(d)))]:
+        total = sc.rescore(d, total, positions, values)
+        assert total == pytest.approx(sc.score_digits(d))
+
+def test_backends_agree(monkeypatch):
+    if scoring.np is None:
+        pytest.skip("numpy not installed")
+    fast = QuadgramScorer.from_text(PLAIN)
+    monkeypatch.setattr(scoring, "np", None)
+    monkeypatch.setattr(corpus, "np", None)
+    slow = QuadgramScorer.from_text(PLAIN)
+    assert list(slow.table) == pytest.approx(fast.table.tolist())
+    assert slow.score(PLAIN) == pytest.approx(fast.score(PLAIN))
+
+def test_english_outscores_gibberish():
+    sc = default_scorer()
+    assert sc.fitness(PLAIN) > sc.fitness(caesar_encrypt(PLAIN, 11)) + 0.5
+    assert sc.score("") == 0.0
+
+def test_table_accepts_float32_buffers():
+    buf = array("f", [-1.0]) * N_QUAD
+    sc = QuadgramScorer(buf.tobytes())
+    assert sc.score("ABCDEF") == pytest.approx(-3.0)
+    with pytest.raises(ValueError):
+        QuadgramScorer(array("f", [0.0] * 10))
+
+def test_caesar_crack_with_scorer_on_short_text():
+    for k in (3, 11, 20):
+        assert caesar_attack.crack(caesar_encrypt("meet me by the old mill", k), scorer=default_scorer())[0] == k
+
+def test_vigenere_crack_with_scorer():
+    c = vigenere_encrypt(PLAIN, "LANTERN")
+    key, pt = vigenere_attack.crack(c, scorer=default_scorer())
+    assert key == "LANTERN"
+    assert pt == scoring.decode(encode(PLAIN))
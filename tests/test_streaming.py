@@ -0,0 +1,74 @@
+import os
+import random
+import pytest
+from cryptolib.classical import caesar, otp, vigenere
+from cryptolib.classical.hill import hill2, hilln
+from cryptolib.classical.playfair import playfair
+from cryptolib.classical.stream import StreamCipher
+from cryptolib.exceptions import ValidationError
+
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcxyz LLOO  ,.!ßﬁJ"
+
+def _random_text(rng: random.Random) -> str:
+    return "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 120)))
+
+def _chunks(rng: random.Random, s):
+    i = 0
+    while i < len(s):
+        j = i + rng.randint(0, 9)  # empty chunks included
+        yield s[i:j]
+        i = j
+
+def _run(stream, rng, s):
+    out = [stream.update(c) for c in _chunks(rng, s)]
+    out.append(stream.finalize())
+    return type(s)().join(out)
+
+CASES = [
+    ("caesar", lambda: caesar.encryptor(7), lambda m: caesar.encrypt(m, 7)),
+    ("caesar-dec", lambda: caesar.decryptor(7), lambda m: caesar.decrypt(m, 7)),
+    ("vigenere", lambda: vigenere.encryptor("LEMON"), lambda m: vigenere.encrypt(m, "LEMON")),
+    ("vigenere-dec", lambda: vigenere.decryptor("LEMON"), lambda m: vigenere.decrypt(m, "LEMON")),
+    ("hill2", lambda: hill2.encryptor([[3, 3], [2, 5]]), lambda m: hill2.encrypt(m, [[3, 3], [2, 5]])),
+    ("hill2-dec", lambda: hill2.decryptor([[3, 3], [2, 5]]), lambda m: hill2.decrypt(m, [[3, 3], [2, 5]])),
+    ("hill3", lambda: hilln.encryptor([[6, 24, 1], [13, 16, 10], [20, 17, 15]]),
+     lambda m: hilln.encrypt(m, [[6, 24, 1], [13, 16, 10], [20, 17, 15]])),
+    ("playfair", lambda: playfair.encryptor("MONARCHY"), lambda m: playfair.encrypt(m, "MONARCHY")),
+    ("playfair-dec", lambda: playfair.decryptor("MONARCHY"), lambda m: playfair.decrypt(m, "MONARCHY")),
+]
+
+@pytest.mark.parametrize("name,make,one_shot", CASES, ids=[c[0] for c in CASES])
+def test_any_chunking_matches_one_shot(name, make, one_shot):
+    rng = random.Random(name)
+    for _ in range(300):
+        m = _random_text(rng)
+        assert _run(make(), rng, m) == one_shot(m)
+
+def test_otp_stream_any_chunking():
+    rng = random.Random(5)
+    for _ in range(200):
+        m = os.urandom(rng.randint(0, 100))
+        k = os.urandom(len(m))
+        assert _run(otp.encryptor(k), rng, m) == otp.encrypt(m, k)
+
+def test_otp_stream_key_length_enforced():
+    enc = otp.encryptor(b"\x00" * 4)
+    with pytest.raises(ValidationError):
+        enc.update(b"12345")
+    enc = otp.encryptor(b"\x00" * 4)
+    enc.update(b"123")
+    with pytest.raises(ValidationError):
+        enc.finalize()
+
+def test_update_after_finalize_raises():
+    enc = vigenere.encryptor("KEY")
+    enc.update("hello")
+    enc.finalize()
+    with pytest.raises(ValidationError):
+        enc.update("more")
+
+def test_subclass_without_update_cannot_be_created():
+    class Incomplete(StreamCipher):
+        pass
+    with pytest.raises(TypeError):
+        Incomplete()
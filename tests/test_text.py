@@ -0,0 +1,25 @@
+from cryptolib.text import clean, clean_bytes, clean_i, clean_i_bytes
+
+NOISY = "Jack & Jill — Straße, ﬁne déjà-vu! 123 ıi ǰ " + "".join(chr(i) for i in range(400))
+
+def _ref(s: str) -> str:
+    return "".join(ch for ch in s.upper() if "A" <= ch <= "Z")
+
+def test_clean_matches_reference():
+    assert clean(NOISY) == _ref(NOISY)
+    assert clean("hello, world") == "HELLOWORLD"
+    assert clean_bytes("abc xyz") == b"ABCXYZ"
+
+def test_j_to_i_variant():
+    assert clean_i(NOISY) == _ref(NOISY).replace("J", "I")
+    assert clean_i("Jam jar") == "IAMIAR"
+
+def test_bytes_fast_path():
+    raw = bytes(range(256)) + b"jump!"
+    assert clean_bytes(raw) == b"ABCDEFGHIJKLMNOPQRSTUVWXYZABCDEFGHIJKLMNOPQRSTUVWXYZJUMP"
+    assert clean_i_bytes(bytearray(b"jj JJ")) == b"IIII"
+    assert clean(memoryview(b"a-b")) == "AB"
+
+def test_cached_results_are_identical():
+    assert clean(NOISY, cache=True) == clean(NOISY)
+    assert clean_i(NOISY, cache=True) == clean_i(NOISY)
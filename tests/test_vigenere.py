@@ -18,4 +18,34 @@ def test_empty_or_bad_key_raises():
     with pytest.raises(ValidationError):
         encrypt("HELLO", "")
     with pytest.raises(ValidationError):
-        decrypt("HELLO", "   ")
\ No newline at end of file
+        decrypt("HELLO", "   ")
+
+def _ref(text: str, key: str, sign: int) -> str:
+    # the original per-character implementation
+    s = "".join(ch for ch in text.upper() if "A" <= ch <= "Z")
+    k = "".join(ch for ch in key.upper() if "A" <= ch <= "Z")
+    return "".join(chr((ord(ch) - 65 + sign * (ord(k[i % len(k)]) - 65)) % 26 + 65)
+                   for i, ch in enumerate(s))
+
+def test_matches_per_char_reference():
+    msg = "Straße, ﬁne déjà-vu! " * 7 + "".join(chr(i) for i in range(300))
+    for key in ("A", "LEMON", "Zebra!", "averyveryverylongkeylongerthanthetextitself" * 20):
+        assert encrypt(msg, key) == _ref(msg, key, +1)
+        assert decrypt(msg, key) == _ref(msg, key, -1)
+    assert encrypt("", "KEY") == ""
+
+def test_numpy_backend_matches_translate_backend():
+    np = pytest.importorskip("numpy")
+    from cryptolib.classical import shift
+    rng = np.random.default_rng(0)
+    data = rng.integers(65, 91, size=10_007, dtype=np.uint8).tobytes()
+    for shifts in [(3,), (0, 25), tuple(range(26)), tuple(rng.integers(0, 26, size=97))]:
+        assert shift._apply_shifts_numpy(data, shifts) == shift._apply_shifts_translate(data, shifts)
+
+def test_large_input_falls_back_without_numpy(monkeypatch):
+    from cryptolib.classical import shift
+    msg = "attack at dawn " * 2000
+    expected = _ref(msg, "LEMON", +1)
+    monkeypatch.setattr(shift, "np", None)
+    assert encrypt(msg, "LEMON") == expected
+    assert decrypt(expected, "LEMON") == _ref(expected, "LEMON", -1)
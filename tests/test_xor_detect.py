@@ -0,0 +1,85 @@
+import os
+import random
+
+import pytest
+from cryptolib.cryptanalysis import xor_detect
+from cryptolib.cryptanalysis._english_sample import TEXT
+from cryptolib.cryptanalysis.xor_detect import scan, scan_file
+
+rng = random.Random(11)
+PLANTED = {}  # line number -> (key, plaintext)
+
+def dump(n: int = 400) -> bytes:
+    lines = []
+    for i in range(n):
+        if i % 97 == 13:
+            j, key = rng.randrange(len(TEXT) - 40), rng.randrange(256)
+            plain = TEXT[j:j + 40].encode()
+            PLANTED[i] = (key, plain)
+            lines.append(bytes(b ^ key for b in plain).hex())
+        elif i % 50 == 7:
+            lines.append("not hex at all, skipped")
+        elif i % 50 == 8:
+            lines.append("abc")  # odd length
+        else:
+            lines.append(os.urandom(rng.randrange(20, 50)).hex().upper() + "\r")
+    return ("\n".join(lines) + "\n").encode()
+
+DATA = dump()
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_finds_planted_lines(monkeypatch, use_numpy):
+    if not use_numpy:
+        monkeypatch.setattr(xor_detect, "np", None)
+    elif xor_detect.np is None:
+        pytest.skip("numpy not installed")
+    hits = scan(DATA, top=len(PLANTED))
+    assert {h.line for h in hits} == set(PLANTED)
+    for h in hits:
+        assert (h.key, h.plaintext) == PLANTED[h.line]
+        assert DATA[h.offset:].split(b"\n", 1)[0] == bytes(b ^ h.key for b in h.plaintext).hex().encode()
+        assert h.score > -2.0
+    assert [h.score for h in hits] == sorted((h.score for h in hits), reverse=True)
+
+def _key(hits):
+    return [(h.line, h.offset, h.key, h.plaintext) for h in hits]
+
+def test_window_size_does_not_change_results():
+    whole = scan(DATA, top=8)
+    for size in (1, 100, 4096):
+        assert _key(scan(DATA, top=8, chunk_size=size)) == _key(whole)
+    assert _key(scan(DATA.rstrip(b"\n"), top=8, chunk_size=333)) == _key(whole)
+
+def test_numpy_and_fallback_agree(monkeypatch):
+    if xor_detect.np is None:
+        pytest.skip("numpy not installed")
+    fast = scan(DATA, top=10)
+    monkeypatch.setattr(xor_detect, "np", None)
+    slow = scan(DATA, top=10)
+    assert _key(fast) == _key(slow)
+    assert [h.score for h in fast] == pytest.approx([h.score for h in slow], rel=1e-5)
+
+def test_raw_lines_and_files(tmp_path):
+    plain = TEXT[:60].replace("\n", " ").encode()
+    raw = b"\n".join([os.urandom(60).replace(b"\n", b"x") for _ in range(30)] + [bytes(b ^ 0x42 for b in plain)])
+    path = tmp_path / "dump.bin"
+    path.write_bytes(raw)
+    (hit,) = scan_file(path, top=1, hexlines=False)
+    assert (hit.line, hit.key, hit.plaintext) == (30, 0x42, plain)
+    empty = tmp_path / "empty"
+    empty.write_bytes(b"")
+    assert scan_file(empty) == []
+
+def test_short_lines_keep_memory_bounded():
+    import tracemalloc
+    pytest.importorskip("numpy")
+    plain = TEXT[:40].encode()
+    data = b"ab\n" * 170_000 + bytes(b ^ 0x42 for b in plain) + b"\n" + b"the quick brown fox\n" * 26_000
+    tracemalloc.start()
+    try:
+        hits = scan(data, top=1, hexlines=False)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert peak < 64 * xor_detect.CHUNK_SIZE  # was ~3 KB per line in the window
+    assert hits[0].line == 170_000 and hits[0].plaintext == plain